@@ -0,0 +1,28 @@
+"""Add (user_id, timestamp) index to briefing_usage.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_briefing_usage_user_id_timestamp",
+        "briefing_usage",
+        ["user_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_briefing_usage_user_id_timestamp", table_name="briefing_usage")
@@ -7,6 +7,8 @@ in analysis/clouds.py.
 
 from __future__ import annotations
 
+import numpy as np
+
 from weatherbrief.models import (
     CloudCoverage,
     DerivedLevel,
@@ -48,38 +50,46 @@ def detect_cloud_layers(
     Returns:
         List of EnhancedCloudLayer, ordered from lowest to highest.
     """
-    if not levels:
+    valid = [
+        lv for lv in levels
+        if lv.dewpoint_depression_c is not None and lv.altitude_ft is not None
+    ]
+    if not valid:
         return []
 
+    dd = np.fromiter((lv.dewpoint_depression_c for lv in valid), dtype=float, count=len(valid))
+
     cloud_layers: list[EnhancedCloudLayer] = []
-    in_cloud = False
-    cloud_levels: list[DerivedLevel] = []
-
-    for lv in levels:
-        if lv.dewpoint_depression_c is None or lv.altitude_ft is None:
-            continue
-
-        if lv.dewpoint_depression_c < dd_threshold:
-            if not in_cloud:
-                in_cloud = True
-                cloud_levels = []
-            cloud_levels.append(lv)
-        elif in_cloud:
-            # End of cloud layer
-            in_cloud = False
-            layer = _build_layer(cloud_levels)
-            if layer is not None:
-                cloud_layers.append(layer)
-
-    # Handle cloud extending to top of profile
-    if in_cloud and cloud_levels:
-        layer = _build_layer(cloud_levels)
+    for start, end in find_cloud_runs(dd, dd_threshold):
+        layer = _build_layer(valid[start:end + 1])
         if layer is not None:
             cloud_layers.append(layer)
 
     return cloud_layers
 
 
+def find_cloud_runs(
+    dewpoint_depression_c: np.ndarray,
+    dd_threshold: float = IN_CLOUD_DD_THRESHOLD,
+) -> list[tuple[int, int]]:
+    """Find runs of consecutive in-cloud levels in a dewpoint depression array.
+
+    Array fast path for callers holding whole profiles as NumPy arrays.
+    NaN values are treated as out of cloud.
+
+    Returns:
+        List of (start, end) index pairs, end inclusive, ordered bottom-up.
+    """
+    mask = np.asarray(dewpoint_depression_c, dtype=float) < dd_threshold
+    if not mask.any():
+        return []
+
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
 def _build_layer(cloud_levels: list[DerivedLevel]) -> EnhancedCloudLayer | None:
     """Build an EnhancedCloudLayer from a group of consecutive cloud levels."""
     if not cloud_levels:
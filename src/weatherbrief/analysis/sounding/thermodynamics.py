@@ -207,6 +207,24 @@ def _compute_bulk_shear(
         return None
 
 
+def _level_values(func, unit: str, *profiles) -> np.ndarray:
+    """Evaluate a level-wise MetPy function over a whole profile.
+
+    Falls back to one call per level if the array call fails, so a bad
+    level only blanks its own value. Failed levels are NaN.
+    """
+    try:
+        return np.asarray(func(*profiles).to(unit).magnitude, dtype=float)
+    except Exception:
+        values = np.full(len(profiles[0]), np.nan)
+        for i, args in enumerate(zip(*profiles)):
+            try:
+                values[i] = func(*args).to(unit).magnitude
+            except Exception:
+                logger.debug("%s failed at level %d", func.__name__, i, exc_info=True)
+        return values
+
+
 def compute_derived_levels(profile: PreparedProfile) -> list[DerivedLevel]:
     """Compute per-level derived values from a prepared sounding profile."""
     pressures = profile.pressure.to("hPa").magnitude
@@ -231,35 +249,34 @@ def compute_derived_levels(profile: PreparedProfile) -> list[DerivedLevel]:
     except Exception:
         rh_vals = [None] * len(pressures)
 
+    # Level-wise MetPy calls, evaluated over the whole profile at once
+    wet_bulbs = _level_values(
+        mpcalc.wet_bulb_temperature, "degC",
+        profile.pressure, profile.temperature, profile.dewpoint,
+    )
+    theta_es = _level_values(
+        mpcalc.equivalent_potential_temperature, "kelvin",
+        profile.pressure, profile.temperature, profile.dewpoint,
+    )
+    w_m_s = None
+    if omega_vals is not None:
+        w_m_s = _level_values(
+            mpcalc.vertical_velocity, "m/s",
+            omega_vals * units("Pa/s"), profile.pressure, profile.temperature,
+        )
+
     levels: list[DerivedLevel] = []
     for i in range(len(pressures)):
         p_hpa = int(pressures[i])
         t_c = float(temps[i])
         td_c = float(dewpoints[i])
 
-        # Wet-bulb temperature
-        wet_bulb = None
-        try:
-            wb = mpcalc.wet_bulb_temperature(
-                pressures[i] * units.hPa, temps[i] * units.degC, dewpoints[i] * units.degC
-            )
-            wet_bulb = round(float(wb.to("degC").magnitude), 1)
-        except Exception:
-            pass
+        wet_bulb = None if np.isnan(wet_bulbs[i]) else round(float(wet_bulbs[i]), 1)
+        theta_e = None if np.isnan(theta_es[i]) else round(float(theta_es[i]), 1)
 
         # Dewpoint depression
         dd = round(t_c - td_c, 1)
 
-        # Theta-E
-        theta_e = None
-        try:
-            te = mpcalc.equivalent_potential_temperature(
-                pressures[i] * units.hPa, temps[i] * units.degC, dewpoints[i] * units.degC
-            )
-            theta_e = round(float(te.to("kelvin").magnitude), 1)
-        except Exception:
-            pass
-
         # Lapse rate between this level and the next (C/km)
         lapse = None
         if i < len(pressures) - 1:
@@ -273,15 +290,8 @@ def compute_derived_levels(profile: PreparedProfile) -> list[DerivedLevel]:
         w_fpm = None
         if omega_vals is not None and not np.isnan(omega_vals[i]):
             omega_pa_s = round(float(omega_vals[i]), 4)
-            try:
-                w = mpcalc.vertical_velocity(
-                    omega_vals[i] * units("Pa/s"),
-                    pressures[i] * units.hPa,
-                    temps[i] * units.degC,
-                )
-                w_fpm = round(float(w.to("m/s").magnitude) * 196.85, 1)  # m/s → ft/min
-            except Exception:
-                logger.debug("Omega→w conversion failed at %s hPa", pressures[i], exc_info=True)
+            if not np.isnan(w_m_s[i]):
+                w_fpm = round(float(w_m_s[i]) * 196.85, 1)  # m/s → ft/min
 
         rh_pct = round(float(rh_vals[i]), 1) if rh_vals[i] is not None else None
 
@@ -69,16 +69,14 @@ def compute_stability_indicators(
             _pressure_to_altitude_ft(p) / M_TO_FT for p in pressures
         ])
 
-    # Compute potential temperature at each level
-    theta = np.empty(len(pressures))
-    for i in range(len(pressures)):
-        try:
-            pt = mpcalc.potential_temperature(
-                pressures[i] * units.hPa, temps[i] * units.degC,
-            )
-            theta[i] = float(pt.to("kelvin").magnitude)
-        except Exception:
-            theta[i] = np.nan
+    # Potential temperature at every level in one vectorized call
+    try:
+        theta = mpcalc.potential_temperature(
+            pressures * units.hPa, temps * units.degC,
+        ).to("kelvin").magnitude
+    except Exception:
+        logger.debug("Failed to compute potential temperature", exc_info=True)
+        theta = np.full(len(pressures), np.nan)
 
     # Compute wind components for shear calculation
     u_vals = np.full(len(pressures), np.nan)
@@ -91,31 +89,33 @@ def compute_stability_indicators(
         except Exception:
             logger.debug("Failed to compute wind components", exc_info=True)
 
-    # Per adjacent layer pair (i is lower, i+1 is upper)
-    for i in range(len(pressures) - 1):
-        if i + 1 >= len(derived_levels):
-            break
-
-        dz = heights_m[i + 1] - heights_m[i]
-        if dz <= 0 or np.isnan(theta[i]) or np.isnan(theta[i + 1]):
-            continue
-
-        theta_mean = (theta[i] + theta[i + 1]) / 2.0
-        d_theta = theta[i + 1] - theta[i]
+    # Adjacent layer pairs: index i is the layer between levels i (lower) and i+1
+    n = min(len(pressures), len(derived_levels))
+    if n < 2:
+        return
+    theta, u_vals, v_vals = theta[:n], u_vals[:n], v_vals[:n]
+    dz = np.diff(heights_m[:n])
 
+    with np.errstate(divide="ignore", invalid="ignore"):
         # Brunt-Vaisala frequency squared: N² = (g/θ) × (dθ/dz)
-        n_sq = (_G / theta_mean) * (d_theta / dz)
-        derived_levels[i + 1].bv_freq_squared_per_s2 = round(float(n_sq), 8)
+        theta_mean = (theta[:-1] + theta[1:]) / 2.0
+        n_sq = (_G / theta_mean) * (np.diff(theta) / dz)
 
         # Wind shear squared: S² = (du/dz)² + (dv/dz)²
-        if not np.isnan(u_vals[i]) and not np.isnan(u_vals[i + 1]):
-            du_dz = (u_vals[i + 1] - u_vals[i]) / dz
-            dv_dz = (v_vals[i + 1] - v_vals[i]) / dz
-            shear_sq = du_dz**2 + dv_dz**2
-
-            if shear_sq > _MIN_SHEAR_SQ:
-                ri = n_sq / shear_sq
-                derived_levels[i + 1].richardson_number = round(float(ri), 2)
+        shear_sq = (np.diff(u_vals) / dz) ** 2 + (np.diff(v_vals) / dz) ** 2
+        ri = n_sq / shear_sq
+
+    has_n_sq = ~(dz <= 0) & ~np.isnan(theta[:-1]) & ~np.isnan(theta[1:])
+    has_ri = (
+        has_n_sq & ~np.isnan(u_vals[:-1]) & ~np.isnan(u_vals[1:])
+        & (shear_sq > _MIN_SHEAR_SQ)
+    )
+
+    for i in np.flatnonzero(has_n_sq):
+        level = derived_levels[i + 1]
+        level.bv_freq_squared_per_s2 = round(float(n_sq[i]), 8)
+        if has_ri[i]:
+            level.richardson_number = round(float(ri[i]), 2)
 
 
 def classify_vertical_motion(
@@ -3,28 +3,38 @@
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import os
 
 from cryptography.fernet import Fernet
 
 
-def _get_fernet_key() -> bytes:
-    """Get the Fernet encryption key.
+def _get_fernet() -> Fernet:
+    """Get the Fernet instance for the current environment.
 
     Uses CREDENTIAL_ENCRYPTION_KEY env var if set.
     In dev mode, derives a key from JWT_SECRET as a fallback.
+    Env is read on every call; derivation is cached per distinct input.
     """
-    explicit_key = os.environ.get("CREDENTIAL_ENCRYPTION_KEY")
-    if explicit_key:
-        return explicit_key.encode()
-
     from weatherbrief.api.auth_config import get_jwt_secret, is_dev_mode
 
-    if is_dev_mode():
+    explicit_key = os.environ.get("CREDENTIAL_ENCRYPTION_KEY", "")
+    dev_mode = is_dev_mode()
+    jwt_secret = get_jwt_secret() if dev_mode and not explicit_key else ""
+    return _derive_fernet(explicit_key, dev_mode, jwt_secret)
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_fernet(explicit_key: str, dev_mode: bool, jwt_secret: str) -> Fernet:
+    """Build a Fernet from the key inputs (cached by _get_fernet)."""
+    if explicit_key:
+        return Fernet(explicit_key.encode())
+
+    if dev_mode:
         # Derive a stable Fernet key from the JWT secret
-        digest = hashlib.sha256(get_jwt_secret().encode()).digest()
-        return base64.urlsafe_b64encode(digest)
+        digest = hashlib.sha256(jwt_secret.encode()).digest()
+        return Fernet(base64.urlsafe_b64encode(digest))
 
     raise ValueError(
         "CREDENTIAL_ENCRYPTION_KEY must be set in production. "
@@ -34,11 +44,9 @@ def _get_fernet_key() -> bytes:
 
 def encrypt(plaintext: str) -> str:
     """Encrypt a plaintext string, returning a Fernet token as a string."""
-    f = Fernet(_get_fernet_key())
-    return f.encrypt(plaintext.encode()).decode()
+    return _get_fernet().encrypt(plaintext.encode()).decode()
 
 
 def decrypt(ciphertext: str) -> str:
     """Decrypt a Fernet token string back to plaintext."""
-    f = Fernet(_get_fernet_key())
-    return f.decrypt(ciphertext.encode()).decode()
+    return _get_fernet().decrypt(ciphertext.encode()).decode()
@@ -207,7 +207,8 @@ def _prepare_refresh(flight, db_path, user_id, flight_id, db=None):
         flight_duration_hours=flight.flight_duration_hours,
     )
 
-    fetch_ts = datetime.now(tz=timezone.utc).isoformat()
+    now = datetime.now(tz=timezone.utc)
+    fetch_ts = now.isoformat()
     pack_path = pack_dir_for(user_id, flight_id, fetch_ts)
     pack_path.mkdir(parents=True, exist_ok=True)
 
@@ -227,7 +228,7 @@ def _prepare_refresh(flight, db_path, user_id, flight_id, db=None):
     if db is not None:
         from weatherbrief.api.usage import check_rate_limits
 
-        check_rate_limits(db, user_id)
+        check_rate_limits(db, user_id, now=now)
 
     options = BriefingOptions(
         fetch_gramet=True,
@@ -249,7 +250,8 @@ def _prepare_refresh(flight, db_path, user_id, flight_id, db=None):
 def _finalize_refresh(flight_id, flight, fetch_ts, pack_path, result, db,
                       user_id=None, model_metadata=None):
     """Shared finalization: build and save pack metadata, log usage, return response."""
-    days_out = (date.fromisoformat(flight.target_date) - datetime.now(timezone.utc).date()).days
+    now = datetime.now(timezone.utc)
+    days_out = (date.fromisoformat(flight.target_date) - now.date()).days
 
     init_times = {}
     if model_metadata:
@@ -274,7 +276,7 @@ def _finalize_refresh(flight_id, flight, fetch_ts, pack_path, result, db,
     if user_id is not None:
         from weatherbrief.api.usage import log_briefing_usage
 
-        log_briefing_usage(db, user_id, flight_id, result.usage)
+        log_briefing_usage(db, user_id, flight_id, result.usage, now=now)
 
     logger.info("Briefing refreshed for %s: %s", flight_id, fetch_ts)
     return meta
@@ -631,14 +633,13 @@ def recalculate_advisories(
     if not ra_path.exists():
         raise HTTPException(status_code=404, detail="Route analyses not available for recalculation")
 
-    ra_data = json_mod.loads(ra_path.read_text())
-    manifest = RouteAnalysesManifest.model_validate(ra_data)
+    manifest = RouteAnalysesManifest.model_validate_json(ra_path.read_bytes())
 
     # Load elevation profile if available
     elevation = None
     ep_path = pack_dir / "elevation_profile.json"
     if ep_path.exists():
-        elevation = ElevationProfile.model_validate_json(ep_path.read_text())
+        elevation = ElevationProfile.model_validate_json(ep_path.read_bytes())
 
     # Load cross-sections for mountain wind evaluator
     cross_sections: list[RouteCrossSection] = []
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import Integer, func
+from sqlalchemy import Integer, case, func
 from sqlalchemy.orm import Session
 
 from weatherbrief.db.deps import current_user_id, get_db
@@ -57,21 +57,21 @@ class UsageSummary(BaseModel):
 # --- Core functions ---
 
 
-def _today_start() -> datetime:
-    """Return midnight UTC for today."""
-    now = datetime.now(timezone.utc)
+def _today_start(now: datetime | None = None) -> datetime:
+    """Return midnight UTC for today (the day of ``now``)."""
+    now = now or datetime.now(timezone.utc)
     return now.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
-def _month_start() -> datetime:
-    """Return midnight UTC on the 1st of this month."""
-    now = datetime.now(timezone.utc)
+def _month_start(now: datetime | None = None) -> datetime:
+    """Return midnight UTC on the 1st of this month (the month of ``now``)."""
+    now = now or datetime.now(timezone.utc)
     return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
-def _query_today_usage(db: Session, user_id: str) -> dict:
+def _query_today_usage(db: Session, user_id: str, now: datetime | None = None) -> dict:
     """Query today's aggregate usage for a user."""
-    today = _today_start()
+    today = _today_start(now)
     row = (
         db.query(
             func.count().label("briefings"),
@@ -93,9 +93,13 @@ def _query_today_usage(db: Session, user_id: str) -> dict:
     }
 
 
-def check_rate_limits(db: Session, user_id: str) -> None:
-    """Check daily rate limits. Raises HTTPException(429) if any limit exceeded."""
-    usage = _query_today_usage(db, user_id)
+def check_rate_limits(db: Session, user_id: str, *, now: datetime | None = None) -> None:
+    """Check daily rate limits. Raises HTTPException(429) if any limit exceeded.
+
+    ``now`` defaults to the wall clock; callers that already read it for the
+    request pass it in so every step agrees on which day it is.
+    """
+    usage = _query_today_usage(db, user_id, now)
 
     if usage["open_meteo"] >= DAILY_LIMITS["open_meteo"]:
         raise HTTPException(
@@ -116,8 +120,12 @@ def check_rate_limits(db: Session, user_id: str) -> None:
 
 def log_briefing_usage(
     db: Session, user_id: str, flight_id: str, usage: BriefingUsage,
+    *, now: datetime | None = None,
 ) -> None:
-    """Insert a BriefingUsageRow after a briefing refresh."""
+    """Insert a BriefingUsageRow after a briefing refresh.
+
+    The row is timestamped ``now`` if given, else by the column default.
+    """
     row = BriefingUsageRow(
         user_id=user_id,
         flight_id=flight_id,
@@ -129,6 +137,8 @@ def log_briefing_usage(
         llm_input_tokens=usage.llm_input_tokens,
         llm_output_tokens=usage.llm_output_tokens,
     )
+    if now is not None:
+        row.timestamp = now
     db.add(row)
     db.flush()
     logger.info(
@@ -138,17 +148,31 @@ def log_briefing_usage(
     )
 
 
-def get_usage_summary(db: Session, user_id: str) -> UsageSummary:
-    """Aggregate today + this month usage for a user."""
-    today_data = _query_today_usage(db, user_id)
+def get_usage_summary(
+    db: Session, user_id: str, *, now: datetime | None = None,
+) -> UsageSummary:
+    """Aggregate today + this month usage for a user in a single query.
+
+    Today is always within this month, so one scan over the month's rows
+    yields both; today's totals are conditional sums.
+    """
+    now = now or datetime.now(timezone.utc)
+    is_today = BriefingUsageRow.timestamp >= _today_start(now)
+    gramet = func.cast(BriefingUsageRow.gramet_fetched, Integer)
+    llm = func.cast(BriefingUsageRow.llm_digest, Integer)
+
+    def _today_sum(value):
+        return func.coalesce(func.sum(case((is_today, value), else_=0)), 0)
 
-    # Month aggregation
-    month = _month_start()
-    month_row = (
+    row = (
         db.query(
+            _today_sum(1).label("today_briefings"),
+            _today_sum(BriefingUsageRow.open_meteo_calls).label("today_open_meteo"),
+            _today_sum(gramet).label("today_gramet"),
+            _today_sum(llm).label("today_llm_digest"),
             func.count().label("briefings"),
-            func.coalesce(func.sum(func.cast(BriefingUsageRow.gramet_fetched, Integer)), 0).label("gramet"),
-            func.coalesce(func.sum(func.cast(BriefingUsageRow.llm_digest, Integer)), 0).label("llm_digest"),
+            func.coalesce(func.sum(gramet), 0).label("gramet"),
+            func.coalesce(func.sum(llm), 0).label("llm_digest"),
             func.coalesce(
                 func.sum(BriefingUsageRow.llm_input_tokens), 0
             ).label("input_tokens"),
@@ -158,32 +182,32 @@ def get_usage_summary(db: Session, user_id: str) -> UsageSummary:
         )
         .filter(
             BriefingUsageRow.user_id == user_id,
-            BriefingUsageRow.timestamp >= month,
+            BriefingUsageRow.timestamp >= _month_start(now),
         )
         .one()
     )
 
     return UsageSummary(
         today=TodayUsage(
-            briefings=today_data["briefings"],
+            briefings=int(row.today_briefings),
             open_meteo=ServiceUsage(
-                used=today_data["open_meteo"],
+                used=int(row.today_open_meteo),
                 limit=DAILY_LIMITS["open_meteo"],
             ),
             gramet=ServiceUsage(
-                used=today_data["gramet"],
+                used=int(row.today_gramet),
                 limit=DAILY_LIMITS["gramet"],
             ),
             llm_digest=ServiceUsage(
-                used=today_data["llm_digest"],
+                used=int(row.today_llm_digest),
                 limit=DAILY_LIMITS["llm_digest"],
             ),
         ),
         month=MonthUsage(
-            briefings=month_row.briefings,
-            gramet=int(month_row.gramet),
-            llm_digest=int(month_row.llm_digest),
-            total_tokens=int(month_row.input_tokens) + int(month_row.output_tokens),
+            briefings=row.briefings,
+            gramet=int(row.gramet),
+            llm_digest=int(row.llm_digest),
+            total_tokens=int(row.input_tokens) + int(row.output_tokens),
         ),
     )
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -98,6 +98,10 @@ class BriefingPackRow(Base):
 
 class BriefingUsageRow(Base):
     __tablename__ = "briefing_usage"
+    # Rate limits and usage summaries aggregate one user's rows since a cutoff
+    __table_args__ = (
+        Index("ix_briefing_usage_user_id_timestamp", "user_id", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(
@@ -0,0 +1,85 @@
+"""Exact-match cache for structured LLM digest responses.
+
+Keyed on a hash of everything that determines the response: provider, model,
+temperature, output schema, system prompt and context. Only deterministic
+(temperature 0) configs are cached. Entries live as JSON files under
+DATA_DIR/.cache/llm_digest/ and expire after a TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+
+from weatherbrief.digest.llm_config import DigestConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 6 * 3600
+
+
+def _cache_dir() -> Path:
+    return Path(os.environ.get("DATA_DIR", "data")) / ".cache" / "llm_digest"
+
+
+def is_cacheable(config: DigestConfig) -> bool:
+    """Only temperature-0 configs give reproducible responses worth reusing."""
+    return config.llm.temperature == 0.0
+
+
+def cache_key(config: DigestConfig, schema_name: str, system_prompt: str, context: str) -> str:
+    """Hash the inputs that fully determine a structured response."""
+    h = hashlib.sha256()
+    for part in (
+        config.llm.provider,
+        config.llm.model,
+        repr(config.llm.temperature),
+        schema_name,
+        system_prompt,
+        context,
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load_cached(key: str, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> str | None:
+    """Return the cached JSON payload for key, or None if missing or expired."""
+    path = _cache_dir() / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        logger.warning("Failed to read LLM digest cache entry %s", path, exc_info=True)
+        return None
+
+
+def _sweep_expired(cache_dir: Path, ttl_seconds: float) -> None:
+    """Delete entries older than ttl_seconds so the cache does not grow unbounded."""
+    cutoff = time.time() - ttl_seconds
+    for entry in cache_dir.glob("*.json"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            continue
+
+
+def store_cached(key: str, payload_json: str) -> None:
+    """Store a JSON payload under key (failures are logged, not raised)."""
+    path = _cache_dir() / f"{key}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(payload_json)
+        tmp.replace(path)
+        _sweep_expired(path.parent, DEFAULT_TTL_SECONDS)
+    except OSError:
+        logger.warning("Failed to write LLM digest cache entry %s", path, exc_info=True)
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 _CONFIGS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "configs" / "weather_digest"
 
@@ -16,6 +16,8 @@ _CONFIGS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "configs"
 class LLMConfig(BaseModel):
     """LLM provider and model configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str = "anthropic"
     model: str = "claude-sonnet-4-5-20250929"
     temperature: float = 0.0
@@ -24,12 +26,16 @@ class LLMConfig(BaseModel):
 class PromptsConfig(BaseModel):
     """Paths to prompt templates (relative to configs/weather_digest/)."""
 
+    model_config = ConfigDict(frozen=True)
+
     briefer: str = "prompts/briefer_v1.md"
 
 
 class DigestConfig(BaseModel):
     """Top-level digest configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = "1.0"
     name: str = "default"
     llm: LLMConfig = LLMConfig()
@@ -6,18 +6,22 @@ and DWD text forecasts via an LLM briefer.
 
 from __future__ import annotations
 
+import functools
 import logging
 from datetime import datetime
 from typing import Literal
 
+from langchain_core.runnables import Runnable
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
+from weatherbrief.digest.llm_cache import cache_key, is_cacheable, load_cached, store_cached
 from weatherbrief.digest.llm_config import DigestConfig, create_llm
-from weatherbrief.digest.prompt_builder import build_digest_context
-from weatherbrief.fetch.dwd_text import DWDTextForecasts, fetch_dwd_text_forecasts
+from weatherbrief.digest.prompt_builder import build_dynamic_suffix, build_static_prefix
+from weatherbrief.fetch.dwd_text import DWDTextForecasts
+from weatherbrief.fetch.dwd_text_cache import get_or_fetch
 from weatherbrief.models import ForecastSnapshot
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,8 @@ class DigestState(TypedDict, total=False):
     previous_digest: WeatherDigest | None
     text_forecasts: DWDTextForecasts | None
     context: str
+    context_prefix: str
+    context_suffix: str
     digest: WeatherDigest | None
     digest_text: str
     llm_input_tokens: int | None
@@ -63,38 +69,94 @@ class DigestState(TypedDict, total=False):
 
 
 def fetch_text_node(state: DigestState) -> dict:
-    """Fetch DWD text forecasts (graceful failure)."""
+    """Fetch DWD text forecasts, reusing a fresh cached copy (graceful failure)."""
     try:
-        text_forecasts = fetch_dwd_text_forecasts()
+        text_forecasts = get_or_fetch()
         return {"text_forecasts": text_forecasts}
     except Exception:
         logger.warning("DWD text forecast fetch failed", exc_info=True)
         return {"text_forecasts": None}
 
 
-def assemble_context_node(state: DigestState) -> dict:
-    """Combine quantitative snapshot + text forecasts into LLM context string."""
-    context = build_digest_context(
+def build_suffix_node(state: DigestState) -> dict:
+    """Format the per-run quantitative context (runs alongside fetch_text)."""
+    suffix = build_dynamic_suffix(
         snapshot=state["snapshot"],
         target_time=state["target_time"],
-        text_forecasts=state.get("text_forecasts"),
         previous_digest=state.get("previous_digest"),
     )
-    return {"context": context}
+    return {"context_suffix": suffix}
+
+
+def assemble_context_node(state: DigestState) -> dict:
+    """Combine quantitative snapshot + text forecasts into LLM context string.
+
+    The slow-changing prefix comes first so provider prompt caches can hit.
+    """
+    prefix = build_static_prefix(state["snapshot"], state.get("text_forecasts"))
+    suffix = state.get("context_suffix")
+    if suffix is None:
+        suffix = build_suffix_node(state)["context_suffix"]
+    return {"context": f"{prefix}\n\n{suffix}", "context_prefix": prefix}
+
+
+def _build_messages(config: DigestConfig, system_prompt: str, state: DigestState) -> list[dict]:
+    """Chat messages for the briefer, with Anthropic cache breakpoints.
+
+    OpenAI and Gemini cache matching prefixes automatically; Anthropic needs
+    explicit cache_control markers on the system prompt and context prefix.
+    """
+    context = state["context"]
+    prefix = state.get("context_prefix")
+    if config.llm.provider != "anthropic":
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": context},
+        ]
+
+    ephemeral = {"type": "ephemeral"}
+    user_blocks: list[dict] = []
+    if prefix and context.startswith(prefix):
+        user_blocks.append({"type": "text", "text": prefix, "cache_control": ephemeral})
+        context = context[len(prefix):]
+    user_blocks.append({"type": "text", "text": context})
+    return [
+        {"role": "system", "content": [
+            {"type": "text", "text": system_prompt, "cache_control": ephemeral},
+        ]},
+        {"role": "user", "content": user_blocks},
+    ]
+
+
+@functools.lru_cache(maxsize=4)
+def _structured_briefer(config: DigestConfig) -> Runnable:
+    """Chat model bound to the WeatherDigest schema, built once per config."""
+    llm = create_llm(config)
+    return llm.with_structured_output(WeatherDigest, include_raw=True)
 
 
 def briefer_node(state: DigestState) -> dict:
     """Call LLM with structured output to produce WeatherDigest."""
     config: DigestConfig = state["config"]
     try:
-        llm = create_llm(config)
-        structured_llm = llm.with_structured_output(WeatherDigest, include_raw=True)
         system_prompt = config.load_prompt("briefer")
 
-        raw_result = structured_llm.invoke([
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": state["context"]},
-        ])
+        key = None
+        if is_cacheable(config):
+            key = cache_key(config, WeatherDigest.__name__, system_prompt, state["context"])
+            cached = load_cached(key)
+            if cached is not None:
+                try:
+                    result = WeatherDigest.model_validate_json(cached)
+                except ValueError:
+                    logger.warning("Ignoring invalid cached digest %s", key)
+                else:
+                    logger.info("Using cached LLM digest %s", key[:12])
+                    digest_text = format_digest_markdown(result, state["snapshot"])
+                    return {"digest": result, "digest_text": digest_text}
+
+        structured_llm = _structured_briefer(config)
+        raw_result = structured_llm.invoke(_build_messages(config, system_prompt, state))
 
         result: WeatherDigest = raw_result["parsed"]
 
@@ -107,6 +169,9 @@ def briefer_node(state: DigestState) -> dict:
                 token_info["llm_input_tokens"] = usage_meta.get("input_tokens")
                 token_info["llm_output_tokens"] = usage_meta.get("output_tokens")
 
+        if key is not None:
+            store_cached(key, result.model_dump_json())
+
         digest_text = format_digest_markdown(result, state["snapshot"])
         return {"digest": result, "digest_text": digest_text, **token_info}
     except Exception as e:
@@ -121,11 +186,15 @@ def build_digest_graph(config: DigestConfig) -> CompiledStateGraph:
     """Build the LangGraph digest pipeline."""
     graph = StateGraph(DigestState)
     graph.add_node("fetch_text", fetch_text_node)
+    graph.add_node("build_suffix", build_suffix_node)
     graph.add_node("assemble", assemble_context_node)
     graph.add_node("briefer", briefer_node)
 
+    # The DWD fetch (network) and the quantitative context (CPU) are
+    # independent: run them as parallel branches, joined at "assemble"
     graph.add_edge(START, "fetch_text")
-    graph.add_edge("fetch_text", "assemble")
+    graph.add_edge(START, "build_suffix")
+    graph.add_edge(["fetch_text", "build_suffix"], "assemble")
     graph.add_edge("assemble", "briefer")
     graph.add_edge("briefer", END)
 
@@ -25,27 +25,66 @@ def build_digest_context(
     text_forecasts: DWDTextForecasts | None = None,
     previous_digest: WeatherDigest | None = None,
 ) -> str:
-    """Build the full context string for the LLM briefer.
+    """Build the full context string for the LLM briefer."""
+    prefix = build_static_prefix(snapshot, text_forecasts)
+    suffix = build_dynamic_suffix(snapshot, target_time, previous_digest)
+    return f"{prefix}\n\n{suffix}"
 
-    Sections:
-    1. Route / date / altitude metadata
-    2. Quantitative data per waypoint
-    3. Model comparison
-    4. DWD text forecasts (German)
-    5. Trend from previous digest
+
+def build_static_prefix(
+    snapshot: ForecastSnapshot,
+    text_forecasts: DWDTextForecasts | None = None,
+) -> str:
+    """Build the slow-changing head of the context.
+
+    Kept first so provider prompt caching can reuse it across runs:
+    1. DWD text forecasts (German) — shared by every flight until reissued
+    2. Route / altitude metadata — fixed for a flight
     """
     sections: list[str] = []
 
-    # --- Header ---
+    # --- Text forecasts ---
+    if text_forecasts and (text_forecasts.short_range or text_forecasts.medium_range):
+        text_lines: list[str] = ["=== TEXT FORECASTS (DWD, German) ==="]
+        if text_forecasts.medium_range:
+            text_lines.append(
+                f"\n--- Mittelfrist (medium-range) ---\n{text_forecasts.medium_range}"
+            )
+        if text_forecasts.short_range:
+            text_lines.append(
+                f"\n--- Kurzfrist (short-range) ---\n{text_forecasts.short_range}"
+            )
+        sections.append("\n".join(text_lines))
+
+    # --- Route ---
     waypoints_str = " -> ".join(wp.icao for wp in snapshot.route.waypoints)
-    days_label = f"D-{snapshot.days_out}" if snapshot.days_out > 0 else "D-0 (today)"
     sections.append(
         f"ROUTE: {waypoints_str}\n"
-        f"DATE: {snapshot.target_date} ({days_label})\n"
         f"ALTITUDE: {snapshot.route.cruise_altitude_ft}ft "
         f"(~{snapshot.route.cruise_pressure_hpa}hPa)"
     )
 
+    return "\n\n".join(sections)
+
+
+def build_dynamic_suffix(
+    snapshot: ForecastSnapshot,
+    target_time: datetime,
+    previous_digest: WeatherDigest | None = None,
+) -> str:
+    """Build the per-run tail of the context.
+
+    Sections:
+    1. Date / days-out
+    2. Quantitative data per waypoint
+    3. Model comparison
+    4. Trend from previous digest
+    """
+    sections: list[str] = []
+
+    days_label = f"D-{snapshot.days_out}" if snapshot.days_out > 0 else "D-0 (today)"
+    sections.append(f"DATE: {snapshot.target_date} ({days_label})")
+
     # --- Quantitative data per waypoint ---
     quant_lines: list[str] = ["=== QUANTITATIVE DATA ==="]
     for wp in snapshot.route.waypoints:
@@ -159,19 +198,6 @@ def build_digest_context(
         comp_lines.append("No multi-model comparison available.")
     sections.append("\n".join(comp_lines))
 
-    # --- Text forecasts ---
-    if text_forecasts and (text_forecasts.short_range or text_forecasts.medium_range):
-        text_lines: list[str] = ["=== TEXT FORECASTS (DWD, German) ==="]
-        if text_forecasts.medium_range:
-            text_lines.append(
-                f"\n--- Mittelfrist (medium-range) ---\n{text_forecasts.medium_range}"
-            )
-        if text_forecasts.short_range:
-            text_lines.append(
-                f"\n--- Kurzfrist (short-range) ---\n{text_forecasts.short_range}"
-            )
-        sections.append("\n".join(text_lines))
-
     # --- Trend ---
     if previous_digest:
         trend_lines: list[str] = ["=== PREVIOUS DIGEST (for trend comparison) ==="]
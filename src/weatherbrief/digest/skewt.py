@@ -15,16 +15,16 @@ from typing import TYPE_CHECKING
 import matplotlib
 
 matplotlib.use("agg")
-import matplotlib.pyplot as plt  # noqa: E402
 import metpy.calc as mpcalc  # noqa: E402
 import numpy as np  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+from matplotlib.patches import Rectangle  # noqa: E402
 from matplotlib.transforms import blended_transform_factory  # noqa: E402
 from metpy.plots import Hodograph, SkewT  # noqa: E402
 from metpy.units import units  # noqa: E402
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
-    from matplotlib.figure import Figure
 
 from weatherbrief.models import ForecastSnapshot, HourlyForecast  # noqa: E402
 from weatherbrief.models.analysis import SoundingAnalysis  # noqa: E402
@@ -59,6 +59,10 @@ _C = dict(
     el="#d62728",
 )
 
+# zlib level 3 instead of Pillow's default 6: noticeably faster to encode
+# for slightly larger files
+_PNG_SAVE_OPTIONS = {"compress_level": 3}
+
 
 def _pressure_to_altitude_ft(p_hpa: float) -> float:
     """Standard-atmosphere pressure → altitude (ft)."""
@@ -205,7 +209,7 @@ def _draw_indices_panel(fig: Figure, analysis: SoundingAnalysis) -> None:
         return
 
     # Background rectangle — pushed right, more compact
-    fig.patches.extend([plt.Rectangle(
+    fig.patches.extend([Rectangle(
         (0.66, 0.05), 0.325, 0.46,
         edgecolor="#dddddd", facecolor="white", linewidth=0.5, alpha=0.95,
         transform=fig.transFigure, figure=fig,
@@ -327,10 +331,10 @@ def generate_skewt(
     # --- Figure layout ---
     has_panels = analysis is not None
     if has_panels:
-        fig = plt.figure(figsize=(13, 10))
+        fig = Figure(figsize=(13, 10))
         skew = SkewT(fig, rotation=45, rect=(0.05, 0.05, 0.57, 0.90))
     else:
-        fig = plt.figure(figsize=(9, 9))
+        fig = Figure(figsize=(9, 9))
         skew = SkewT(fig, rotation=45)
 
     # --- Temperature & dewpoint ---
@@ -463,8 +467,10 @@ def generate_skewt(
 
     # --- Save ---
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
+    fig.savefig(
+        output_path, dpi=150, bbox_inches="tight", facecolor="white",
+        pil_kwargs=_PNG_SAVE_OPTIONS,
+    )
 
     return output_path
 
@@ -0,0 +1,101 @@
+"""TTL cache for DWD text forecasts.
+
+DWD issues the synoptic overviews at most a few times a day, so repeated
+digest runs within the same hour can reuse one fetch. Entries are kept
+in-process and on disk under DATA_DIR/.cache/dwd_text/ for cross-process reuse.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from weatherbrief.fetch import dwd_text
+from weatherbrief.fetch.dwd_text import DWDTextForecasts
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 1800
+
+_memory: dict[datetime, DWDTextForecasts] = {}
+
+
+def _cache_dir() -> Path:
+    return Path(os.environ.get("DATA_DIR", "data")) / ".cache" / "dwd_text"
+
+
+def _issuance_hour(now: datetime) -> datetime:
+    return now.replace(minute=0, second=0, microsecond=0)
+
+
+def _is_fresh(forecasts: DWDTextForecasts, now: datetime, ttl_seconds: float) -> bool:
+    return (now - forecasts.fetched_at).total_seconds() < ttl_seconds
+
+
+def _read_disk(path: Path) -> DWDTextForecasts | None:
+    try:
+        return DWDTextForecasts.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        logger.warning("Ignoring unreadable DWD text cache entry %s", path)
+        return None
+
+
+def _write_disk(path: Path, forecasts: DWDTextForecasts) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(forecasts.model_dump_json())
+        tmp.replace(path)
+    except OSError:
+        logger.warning("Failed to write DWD text cache entry %s", path, exc_info=True)
+        return
+    _remove_older_entries(path)
+
+
+def _remove_older_entries(current: Path) -> None:
+    """Delete disk entries for earlier hours; only the current hour is ever served."""
+    for entry in current.parent.glob("*.json"):
+        if entry.name == current.name:
+            continue
+        try:
+            entry.unlink()
+        except OSError:
+            logger.warning("Failed to remove stale DWD text cache entry %s", entry)
+
+
+def get_or_fetch(ttl_seconds: float = DEFAULT_TTL_SECONDS) -> DWDTextForecasts:
+    """Return DWD text forecasts, fetching only if no fresh entry exists.
+
+    Entries are keyed on the current UTC hour and expire after ttl_seconds.
+    Fetches where both texts failed are returned but never cached.
+    """
+    now = datetime.now(timezone.utc)
+    hour = _issuance_hour(now)
+
+    cached = _memory.get(hour)
+    if cached is not None and _is_fresh(cached, now, ttl_seconds):
+        return cached
+
+    path = _cache_dir() / f"{hour:%Y%m%dT%H}.json"
+    cached = _read_disk(path)
+    if cached is not None and _is_fresh(cached, now, ttl_seconds):
+        _memory[hour] = cached
+        return cached
+
+    forecasts = dwd_text.fetch_dwd_text_forecasts()
+    if forecasts.short_range is None and forecasts.medium_range is None:
+        return forecasts
+
+    _memory.clear()  # only the current hour is ever served
+    _memory[hour] = forecasts
+    _write_disk(path, forecasts)
+    return forecasts
+
+
+def clear_memory_cache() -> None:
+    """Drop in-process entries (disk entries are left in place)."""
+    _memory.clear()
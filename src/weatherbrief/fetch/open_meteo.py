@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
-import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import numpy as np
 import requests
+from numpy.typing import ArrayLike
 
 from weatherbrief.fetch.variables import (
     MODEL_ENDPOINTS,
@@ -31,21 +33,74 @@ MAGNUS_B = 17.67
 MAGNUS_C = 243.5  # °C
 
 
-def magnus_dewpoint(temp_c: float, rh_pct: float) -> float:
+def magnus_dewpoint(
+    temp_c: float | ArrayLike, rh_pct: float | ArrayLike,
+) -> float | np.ndarray:
     """Derive dewpoint from temperature and relative humidity using the Magnus formula.
 
     γ = ln(RH/100) + (b × T) / (c + T)
     Td = (c × γ) / (b - γ)
+
+    Accepts scalars (returns float) or arrays (returns ndarray, element-wise).
+    """
+    t = np.asarray(temp_c, dtype=float)
+    rh = np.asarray(rh_pct, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = np.log(rh / 100.0) + (MAGNUS_B * t) / (MAGNUS_C + t)
+        dp = (MAGNUS_C * gamma) / (MAGNUS_B - gamma)
+    dp = np.where(rh <= 0, t - 30.0, dp)  # very dry fallback
+    return float(dp) if dp.ndim == 0 else dp
+
+
+_DERIVED_DEWPOINT_DECIMALS = 1
+
+
+def _as_float_array(values: list | None, n: int) -> np.ndarray:
+    """Convert an API value list to a length-n float array.
+
+    None entries, and any positions past the end of the list, become NaN.
+    """
+    out = np.full(n, np.nan)
+    if values:
+        arr = np.array(values[:n], dtype=float)  # None -> nan
+        out[:len(arr)] = arr
+    return out
+
+
+def _with_derived_dewpoints(hourly_data: dict) -> dict:
+    """Fill missing pressure-level dewpoints from temperature + RH, all hours at once.
+
+    Returns a shallow copy of hourly_data; existing dewpoint values are kept.
     """
-    if rh_pct <= 0:
-        return temp_c - 30.0  # very dry fallback
-    gamma = math.log(rh_pct / 100.0) + (MAGNUS_B * temp_c) / (MAGNUS_C + temp_c)
-    return (MAGNUS_C * gamma) / (MAGNUS_B - gamma)
+    n = len(hourly_data.get("time", []))
+    if n == 0:
+        return hourly_data
+
+    data = dict(hourly_data)
+    for level in PRESSURE_LEVELS:
+        t_key = f"temperature_{level}hPa"
+        rh_key = f"relative_humidity_{level}hPa"
+        if t_key not in data or rh_key not in data:
+            continue
+        dp_key = f"dewpoint_{level}hPa"
+        dp = _as_float_array(data.get(dp_key), n)
+        missing = np.isnan(dp)
+        if not missing.any():
+            continue
+        derived = magnus_dewpoint(_as_float_array(data[t_key], n), _as_float_array(data[rh_key], n))
+        # Match the API's 0.1 °C resolution: keeps persisted snapshots compact
+        derived = np.round(derived, _DERIVED_DEWPOINT_DECIMALS)
+        dp = np.where(missing, derived, dp)
+        data[dp_key] = [None if np.isnan(v) else v for v in dp.tolist()]
+    return data
 
 
 _MAX_RETRIES = 3
 _RETRY_BACKOFF = [5, 15, 30]  # seconds
 
+# Cap on concurrent model requests, to stay clear of Open-Meteo rate limits
+_MAX_PARALLEL_FETCHES = 4
+
 
 class OpenMeteoClient:
     """Client for fetching forecasts from the Open-Meteo API."""
@@ -98,7 +153,7 @@ class OpenMeteoClient:
         resp = self._get_with_retry(endpoint.base_url, params)
         data = resp.json()
 
-        hourly_data = data.get("hourly", {})
+        hourly_data = _with_derived_dewpoints(data.get("hourly", {}))
         timestamps = hourly_data.get("time", [])
         forecasts = []
 
@@ -121,10 +176,11 @@ class OpenMeteoClient:
     ) -> list[WaypointForecast]:
         """Fetch forecasts from multiple models, continuing on individual failures.
 
-        If days_out is provided, models whose max forecast range is shorter
-        than days_out are skipped.
+        Models are fetched concurrently (one request each); results keep the
+        order of ``models``. If days_out is provided, models whose max forecast
+        range is shorter than days_out are skipped.
         """
-        results = []
+        to_fetch = []
         for model in models:
             endpoint = MODEL_ENDPOINTS[model.value]
             if days_out is not None and days_out >= endpoint.max_days:
@@ -133,15 +189,24 @@ class OpenMeteoClient:
                     model.value, waypoint.icao, days_out, endpoint.max_days,
                 )
                 continue
+            to_fetch.append(model)
+        if not to_fetch:
+            return []
+
+        def _fetch_one(model: ModelSource) -> WaypointForecast | None:
             try:
-                result = self.fetch_forecast(waypoint, model)
-                results.append(result)
+                return self.fetch_forecast(waypoint, model)
             except Exception:
                 logger.warning(
                     "Failed to fetch %s for %s", model.value, waypoint.icao,
                     exc_info=True,
                 )
-        return results
+                return None
+
+        workers = min(len(to_fetch), _MAX_PARALLEL_FETCHES)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(_fetch_one, to_fetch))
+        return [r for r in fetched if r is not None]
 
     def fetch_multi_point(
         self,
@@ -197,7 +262,7 @@ class OpenMeteoClient:
         results: list[WaypointForecast] = []
 
         for point, point_data in zip(points, response_json):
-            hourly_data = point_data.get("hourly", {})
+            hourly_data = _with_derived_dewpoints(point_data.get("hourly", {}))
             timestamps = hourly_data.get("time", [])
 
             hourly_list = [
@@ -246,20 +311,13 @@ class OpenMeteoClient:
         # Parse pressure level data
         pressure_levels = []
         for level in PRESSURE_LEVELS:
-            temp = get(f"temperature_{level}hPa")
-            rh = get(f"relative_humidity_{level}hPa")
-            dp = get(f"dewpoint_{level}hPa")
-
-            # Derive dewpoint from temp + RH if not directly available
-            if dp is None and temp is not None and rh is not None:
-                dp = magnus_dewpoint(temp, rh)
-
+            # Missing dewpoints were derived up front by _with_derived_dewpoints
             pressure_levels.append(
                 PressureLevelData(
                     pressure_hpa=level,
-                    temperature_c=temp,
-                    relative_humidity_pct=rh,
-                    dewpoint_c=dp,
+                    temperature_c=get(f"temperature_{level}hPa"),
+                    relative_humidity_pct=get(f"relative_humidity_{level}hPa"),
+                    dewpoint_c=get(f"dewpoint_{level}hPa"),
                     wind_speed_kt=get(f"wind_speed_{level}hPa"),
                     wind_direction_deg=get(f"wind_direction_{level}hPa"),
                     geopotential_height_m=get(f"geopotential_height_{level}hPa"),
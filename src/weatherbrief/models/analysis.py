@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class Waypoint(BaseModel):
@@ -56,6 +56,8 @@ def altitude_to_pressure_hpa(altitude_ft: int) -> int:
 class RouteConfig(BaseModel):
     """A flight route definition loaded from config."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     waypoints: list[Waypoint] = Field(min_length=2)
     cruise_altitude_ft: int = 8000
@@ -192,10 +194,10 @@ class WaypointForecast(BaseModel):
     hourly: list[HourlyForecast] = Field(default_factory=list)
 
     def at_time(self, target: datetime) -> Optional[HourlyForecast]:
-        """Find the forecast hour closest to target time."""
+        """Find the forecast hour closest to target time (earlier hour on ties)."""
         if not self.hourly:
             return None
-        return min(self.hourly, key=lambda h: abs((h.time - target).total_seconds()))
+        return min(self.hourly, key=lambda h: (abs(h.time - target), h.time))
 
 
 # --- Analysis result models ---
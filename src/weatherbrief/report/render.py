@@ -6,6 +6,7 @@ import base64
 import json
 import logging
 from pathlib import Path
+from typing import Any, Callable
 
 from jinja2 import Environment, PackageLoader
 
@@ -173,9 +174,16 @@ def render_pdf(
     pack_dir: Path,
     flight: Flight,
     pack: BriefingPackMeta,
+    *,
+    html_cls: Callable[..., Any] | None = None,
 ) -> bytes:
-    """Render PDF from HTML via WeasyPrint."""
-    import weasyprint
+    """Render PDF from HTML via WeasyPrint.
+
+    ``html_cls`` stands in for ``weasyprint.HTML``; WeasyPrint is only
+    imported when it is not given.
+    """
+    if html_cls is None:
+        from weasyprint import HTML as html_cls
 
     html = render_html(pack_dir, flight, pack)
-    return weasyprint.HTML(string=html).write_pdf()
+    return html_cls(string=html).write_pdf()
@@ -120,19 +120,24 @@ def list_flights(session: Session, user_id: str) -> list[Flight]:
     return [_row_to_flight(r) for r in rows]
 
 
-def delete_flight(session: Session, flight_id: str) -> None:
-    """Delete a flight and all its packs. Raises KeyError if not found."""
+def delete_flight(session: Session, flight_id: str) -> list[Path]:
+    """Delete a flight and all its packs. Raises KeyError if not found.
+
+    Returns the pack artifact directories that were removed from disk.
+    """
     row = session.get(FlightRow, flight_id)
     if row is None:
         raise KeyError(f"Flight not found: {flight_id}")
 
     # Remove artifact directories for all packs
+    removed: list[Path] = []
     for pack in row.packs:
-        if pack.artifact_path:
-            _rmtree(Path(pack.artifact_path))
+        if pack.artifact_path and _rmtree(Path(pack.artifact_path)):
+            removed.append(Path(pack.artifact_path))
 
     session.delete(row)  # cascades to briefing_packs
     session.flush()
+    return removed
 
 
 # --- BriefingPack operations ---
@@ -200,7 +205,10 @@ def pack_dir_for(user_id: str, flight_id: str, fetch_timestamp: str) -> Path:
 # --- Utilities ---
 
 
-def _rmtree(path: Path) -> None:
-    """Recursively remove a directory tree."""
-    if path.exists():
+def _rmtree(path: Path) -> bool:
+    """Recursively remove a directory tree. Returns False if it did not exist."""
+    try:
         shutil.rmtree(path)
+    except FileNotFoundError:
+        return False
+    return True
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 
@@ -65,8 +64,7 @@ def load_snapshot(
     snap_dir = _snapshot_dir(target_date, days_out, fetch_date, data_dir)
     snap_path = snap_dir / "snapshot.json"
 
-    raw = json.loads(snap_path.read_text())
-    return ForecastSnapshot.model_validate(raw)
+    return ForecastSnapshot.model_validate_json(snap_path.read_bytes())
 
 
 def list_snapshots(
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from weatherbrief.api.app import create_app
+from weatherbrief.db.deps import current_user_id, get_db
 from weatherbrief.db.engine import DEV_USER_ID
 from weatherbrief.db.models import Base, UserPreferencesRow, UserRow
 from weatherbrief.models import (
+    BriefingPackMeta,
+    Flight,
     HourlyForecast,
     ModelSource,
     PressureLevelData,
@@ -22,30 +28,136 @@ from weatherbrief.models import (
 
 
 @pytest.fixture
-def db_engine():
-    """In-memory SQLite engine for tests."""
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
-    )
+def env():
+    """Batch-set env vars via one os.environ.update; snapshot restored after the test.
+
+    Usage: ``env(NAME="value", OTHER="value")``.
+    """
+    saved = os.environ.copy()
+    yield os.environ.update
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine_factory():
+    """Build in-memory SQLite test engines; all are disposed at session end.
+
+    Foreign keys are enforced as in production. pysqlite's legacy
+    transaction handling is switched off and SQLAlchemy emits BEGIN itself,
+    so ``conn.begin()`` really opens the outer transaction and a session
+    SAVEPOINT nests inside it (the PRAGMA also only works outside one).
+    """
+    engines = []
+
+    def _make():
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragma(dbapi_conn, _connection_record):
+            dbapi_conn.isolation_level = None
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+
+        @event.listens_for(engine, "begin")
+        def _begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        engines.append(engine)
+        return engine
 
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_conn, _connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    yield _make
+    for engine in engines:
+        engine.dispose()
 
+
+@pytest.fixture(scope="session")
+def db_engine(sqlite_engine_factory):
+    """In-memory SQLite engine for tests, schema created once per session."""
+    engine = sqlite_engine_factory()
     Base.metadata.create_all(engine)
-    yield engine
-    engine.dispose()
+    return engine
 
 
 @pytest.fixture
 def db_session(db_engine):
-    """Yield a SQLAlchemy session per test, rolled back after."""
-    session = sessionmaker(bind=db_engine)()
+    """Yield a SQLAlchemy session per test inside a transaction rolled back after.
+
+    Commits inside the test only release a SAVEPOINT, so nothing leaks
+    into the shared schema.
+    """
+    conn = db_engine.connect()
+    trans = conn.begin()
+    session = Session(bind=conn, join_transaction_mode="create_savepoint")
     yield session
-    session.rollback()
     session.close()
+    trans.rollback()
+    conn.close()
+
+
+@pytest.fixture
+def app_db(db_engine):
+    """Session factory on a connection seeded with the dev user, rolled back after each test.
+
+    Commits made by the app only release a SAVEPOINT inside the outer
+    transaction, which ``db_engine`` opens with an explicit BEGIN.
+    """
+    conn = db_engine.connect()
+    trans = conn.begin()
+    conn.execute(UserRow.__table__.insert(), {
+        "id": DEV_USER_ID, "provider": "local", "provider_sub": "dev",
+        "email": "dev@localhost", "display_name": "Dev User", "approved": True,
+    })
+    conn.execute(UserPreferencesRow.__table__.insert(), {"user_id": DEV_USER_ID})
+    yield sessionmaker(bind=conn, join_transaction_mode="create_savepoint")
+    trans.rollback()
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def api_app(tmp_path_factory):
+    """App built once per module in dev mode, acting as the dev user.
+
+    ``get_db`` opens sessions from the factory ``api_client`` binds for
+    each test. The environment is restored afterwards.
+    """
+    saved = os.environ.copy()
+    os.environ.update({
+        "DATA_DIR": str(tmp_path_factory.mktemp("data")),
+        "ENVIRONMENT": "development",
+        "JWT_SECRET": "test-secret",
+    })
+    app = create_app()
+    # Clear after create_app() since load_dotenv() may re-inject from .env
+    os.environ.pop("CREDENTIAL_ENCRYPTION_KEY", None)
+
+    def _override_get_db():
+        session = app.state.test_session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    app.dependency_overrides[current_user_id] = lambda: DEV_USER_ID
+    app.dependency_overrides[get_db] = _override_get_db
+    yield app
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture
+def api_client(api_app, app_db):
+    """Client on the module's app, bound to this test's rolled-back DB transaction."""
+    api_app.state.test_session_factory = app_db
+    yield TestClient(api_app, raise_server_exceptions=False)
+    del api_app.state.test_session_factory
 
 
 @pytest.fixture
@@ -65,12 +177,40 @@ def dev_user(db_session):
     return DEV_USER_ID
 
 
+@pytest.fixture(scope="session")
+def sample_flight():
+    return Flight(
+        id="egtk_lsgs-2026-02-21",
+        user_id=DEV_USER_ID,
+        route_name="egtk_lsgs",
+        target_date="2026-02-21",
+        target_time_utc=9,
+        cruise_altitude_ft=8000,
+        flight_duration_hours=4.5,
+        created_at=datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_pack_meta():
+    return BriefingPackMeta(
+        flight_id="egtk_lsgs-2026-02-21",
+        fetch_timestamp="2026-02-19T18:00:00Z",
+        days_out=2,
+        has_gramet=True,
+        has_skewt=True,
+        has_digest=True,
+        assessment="GREEN",
+        assessment_reason="Ridge established, models converging",
+    )
+
+
 @pytest.fixture
 def sample_waypoint():
     return Waypoint(icao="EGTK", name="Oxford Kidlington", lat=51.8361, lon=-1.32)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_route():
     return RouteConfig(
         name="Oxford to Sion",
@@ -84,7 +224,7 @@ def sample_route():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pressure_levels():
     """Realistic pressure level data for testing."""
     return [
@@ -8,48 +8,14 @@ from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from weatherbrief.api.app import create_app
 from weatherbrief.db.deps import current_user_id, get_db
 from weatherbrief.db.engine import DEV_USER_ID
-from weatherbrief.db.models import Base, UserPreferencesRow, UserRow
 from weatherbrief.models import BriefingPackMeta, Flight
 from weatherbrief.storage.flights import pack_dir_for, save_flight, save_pack_meta
 
 
-@pytest.fixture
-def app_db():
-    """In-memory SQLite engine + session factory for the test app."""
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
-    )
-
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_conn, _connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
-
-    Base.metadata.create_all(engine)
-    TestSession = sessionmaker(bind=engine)
-
-    # Seed dev user
-    session = TestSession()
-    session.add(UserRow(
-        id=DEV_USER_ID, provider="local", provider_sub="dev",
-        email="dev@localhost", display_name="Dev User", approved=True,
-    ))
-    session.add(UserPreferencesRow(user_id=DEV_USER_ID))
-    session.commit()
-    session.close()
-
-    yield TestSession
-    engine.dispose()
-
-
 @pytest.fixture
 def tmp_config_dir(tmp_path):
     """Temporary config directory with sample routes.yaml."""
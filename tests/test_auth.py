@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
+import os
+import time
 from datetime import datetime, timezone
 
+import httpx
+import jwt as pyjwt
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from weatherbrief.api.app import create_app
 from weatherbrief.api.auth_config import COOKIE_NAME
 from weatherbrief.api.jwt_utils import create_token
 from weatherbrief.db.deps import current_user_id, get_db
 from weatherbrief.db.engine import DEV_USER_ID
-from weatherbrief.db.models import Base, UserPreferencesRow, UserRow
+from weatherbrief.db.models import Base, FlightRow, UserPreferencesRow, UserRow
 from weatherbrief.models import Flight
 from weatherbrief.storage.flights import save_flight
 
@@ -24,55 +27,67 @@ USER_A_ID = "user-aaa-111"
 USER_B_ID = "user-bbb-222"
 
 
-@pytest.fixture
-def auth_db():
-    """In-memory SQLite with two test users."""
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
-    )
+@pytest.fixture(scope="module", autouse=True)
+def _auth_env(tmp_path_factory):
+    """Production-mode env set once for the module, restored afterwards."""
+    saved = os.environ.copy()
+    os.environ.update({
+        "DATA_DIR": str(tmp_path_factory.mktemp("data")),
+        "ENVIRONMENT": "production",
+        "JWT_SECRET": TEST_SECRET,
+    })
+    yield
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture(scope="session")
+def auth_engine(sqlite_engine_factory):
+    """In-memory SQLite with two test users, built once per session."""
+    engine = sqlite_engine_factory()
+    Base.metadata.create_all(engine)
 
-    @event.listens_for(engine, "connect")
-    def _pragma(dbapi_conn, _):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    # Two approved users, seeded with Core bulk inserts (no ORM bookkeeping)
+    with engine.begin() as conn:
+        conn.execute(UserRow.__table__.insert(), [
+            {"id": USER_A_ID, "provider": "google", "provider_sub": "goog-a",
+             "email": "alice@test.com", "display_name": "Alice", "approved": True},
+            {"id": USER_B_ID, "provider": "google", "provider_sub": "goog-b",
+             "email": "bob@test.com", "display_name": "Bob", "approved": True},
+        ])
+        conn.execute(UserPreferencesRow.__table__.insert(), [
+            {"user_id": USER_A_ID},
+            {"user_id": USER_B_ID},
+        ])
 
-    Base.metadata.create_all(engine)
-    TestSession = sessionmaker(bind=engine)
-
-    session = TestSession()
-    # User A — approved
-    session.add(UserRow(
-        id=USER_A_ID, provider="google", provider_sub="goog-a",
-        email="alice@test.com", display_name="Alice", approved=True,
-    ))
-    session.add(UserPreferencesRow(user_id=USER_A_ID))
-    # User B — approved
-    session.add(UserRow(
-        id=USER_B_ID, provider="google", provider_sub="goog-b",
-        email="bob@test.com", display_name="Bob", approved=True,
-    ))
-    session.add(UserPreferencesRow(user_id=USER_B_ID))
-    session.commit()
-    session.close()
+    return engine
 
-    yield TestSession
-    engine.dispose()
 
+@pytest.fixture(scope="class")
+def auth_conn(auth_engine):
+    """Connection whose outer transaction spans a test class, rolled back after."""
+    conn = auth_engine.connect()
+    trans = conn.begin()
+    yield conn
+    trans.rollback()
+    conn.close()
 
-def _make_client(auth_db, tmp_path, monkeypatch, user_id: str | None = None):
-    """Create a test client, optionally injecting a specific user."""
-    import weatherbrief.api.routes as routes_mod
 
-    # Minimal routes config
-    config_dir = tmp_path / "config"
-    config_dir.mkdir(exist_ok=True)
-    (config_dir / "routes.yaml").write_text("routes: {}\n")
-    monkeypatch.setattr(routes_mod, "CONFIG_DIR", config_dir)
-    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
-    monkeypatch.setenv("ENVIRONMENT", "production")
-    monkeypatch.setenv("JWT_SECRET", TEST_SECRET)
+def _session_factory(conn):
+    """Sessions on conn whose commits only release a SAVEPOINT."""
+    return sessionmaker(bind=conn, join_transaction_mode="create_savepoint")
 
+
+@pytest.fixture
+def auth_db(auth_conn):
+    """Session factory whose commits are rolled back after each test."""
+    savepoint = auth_conn.begin_nested()
+    yield _session_factory(auth_conn)
+    savepoint.rollback()
+
+
+def _make_app(auth_db, user_id: str | None = None):
+    """Create the app with a test DB, optionally injecting a specific user."""
     app = create_app()
 
     def _override_get_db():
@@ -89,27 +104,54 @@ def _make_client(auth_db, tmp_path, monkeypatch, user_id: str | None = None):
     app.dependency_overrides[get_db] = _override_get_db
 
     if user_id is not None:
-        app.dependency_overrides[current_user_id] = lambda: user_id
+        _act_as(app, user_id)
+
+    return app
+
 
+def _act_as(app, user_id: str) -> None:
+    """Authenticate subsequent requests to app as user_id."""
+    app.dependency_overrides[current_user_id] = lambda: user_id
+
+
+def _make_client(auth_db, user_id: str | None = None):
+    """Create a test client, optionally injecting a specific user."""
+    app = _make_app(auth_db, user_id)
     return TestClient(app, raise_server_exceptions=False)
 
 
 @pytest.fixture
-def client_a(auth_db, tmp_path, monkeypatch):
+def client_a(auth_db):
     """Client authenticated as User A."""
-    return _make_client(auth_db, tmp_path, monkeypatch, USER_A_ID)
+    return _make_client(auth_db, USER_A_ID)
+
+
+@pytest.fixture
+def client_unauth(auth_db):
+    """Client with no auth (production mode, no cookie override)."""
+    return _make_client(auth_db, user_id=None)
 
 
 @pytest.fixture
-def client_b(auth_db, tmp_path, monkeypatch):
-    """Client authenticated as User B."""
-    return _make_client(auth_db, tmp_path, monkeypatch, USER_B_ID)
+def anyio_backend():
+    return "asyncio"
 
 
 @pytest.fixture
-def client_unauth(auth_db, tmp_path, monkeypatch):
-    """Client with no auth (production mode, no cookie override)."""
-    return _make_client(auth_db, tmp_path, monkeypatch, user_id=None)
+def asgi_app(auth_db):
+    """App for direct ASGI dispatch; tests pick the user with _act_as()."""
+    return _make_app(auth_db)
+
+
+@pytest.fixture
+async def async_client(asgi_app):
+    """Async client calling the ASGI app directly, without TestClient's thread portal.
+
+    Use for JSON-only assertions; keep TestClient for redirect/cookie tests.
+    """
+    transport = httpx.ASGITransport(app=asgi_app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
 
 
 class TestAuthMe:
@@ -135,19 +177,17 @@ class TestAuthLogout:
 
 
 class TestJWTCookie:
-    def test_valid_jwt_cookie(self, auth_db, tmp_path, monkeypatch):
+    def test_valid_jwt_cookie(self, auth_db):
         """A real JWT cookie (no dependency override) should authenticate."""
-        client = _make_client(auth_db, tmp_path, monkeypatch, user_id=None)
+        client = _make_client(auth_db, user_id=None)
         token = create_token(USER_A_ID, "alice@test.com", "Alice", TEST_SECRET)
         resp = client.get("/auth/me", cookies={COOKIE_NAME: token})
         assert resp.status_code == 200
         assert resp.json()["id"] == USER_A_ID
 
-    def test_expired_jwt_returns_401(self, auth_db, tmp_path, monkeypatch):
+    def test_expired_jwt_returns_401(self, auth_db):
         """An expired JWT should return 401."""
-        import time
-        import jwt as pyjwt
-        client = _make_client(auth_db, tmp_path, monkeypatch, user_id=None)
+        client = _make_client(auth_db, user_id=None)
         payload = {
             "sub": USER_A_ID,
             "email": "alice@test.com",
@@ -159,9 +199,9 @@ class TestJWTCookie:
         resp = client.get("/auth/me", cookies={COOKIE_NAME: token})
         assert resp.status_code == 401
 
-    def test_invalid_jwt_returns_401(self, auth_db, tmp_path, monkeypatch):
+    def test_invalid_jwt_returns_401(self, auth_db):
         """A bogus JWT should return 401."""
-        client = _make_client(auth_db, tmp_path, monkeypatch, user_id=None)
+        client = _make_client(auth_db, user_id=None)
         resp = client.get("/auth/me", cookies={COOKIE_NAME: "garbage"})
         assert resp.status_code == 401
 
@@ -175,59 +215,77 @@ class TestLoginRedirect:
         assert "accounts.google.com" in location
 
 
+@pytest.fixture(scope="class")
+def flights_seeded(auth_conn):
+    """Seed both users' flights once for the class (outside per-test savepoints)."""
+    session = _session_factory(auth_conn)()
+    flight_a = Flight(
+        id="flight-a-2026-03-01",
+        user_id=USER_A_ID,
+        route_name="alice_route",
+        waypoints=["EGTK", "LSGS"],
+        target_date="2026-03-01",
+        target_time_utc=9,
+        cruise_altitude_ft=8000,
+        created_at=datetime(2026, 2, 20, tzinfo=timezone.utc),
+    )
+    flight_b = Flight(
+        id="flight-b-2026-03-01",
+        user_id=USER_B_ID,
+        route_name="bob_route",
+        waypoints=["LFPB", "LFMT"],
+        target_date="2026-03-01",
+        target_time_utc=10,
+        cruise_altitude_ft=10000,
+        created_at=datetime(2026, 2, 20, tzinfo=timezone.utc),
+    )
+    save_flight(session, flight_a, USER_A_ID)
+    save_flight(session, flight_b, USER_B_ID)
+    session.commit()
+    session.close()
+
+
 class TestFlightOwnership:
     """Verify that users can only see their own flights."""
 
-    @pytest.fixture
-    def flights_seeded(self, auth_db):
-        session = auth_db()
-        flight_a = Flight(
-            id="flight-a-2026-03-01",
-            user_id=USER_A_ID,
-            route_name="alice_route",
-            waypoints=["EGTK", "LSGS"],
-            target_date="2026-03-01",
-            target_time_utc=9,
-            cruise_altitude_ft=8000,
-            created_at=datetime(2026, 2, 20, tzinfo=timezone.utc),
-        )
-        flight_b = Flight(
-            id="flight-b-2026-03-01",
-            user_id=USER_B_ID,
-            route_name="bob_route",
-            waypoints=["LFPB", "LFMT"],
-            target_date="2026-03-01",
-            target_time_utc=10,
-            cruise_altitude_ft=10000,
-            created_at=datetime(2026, 2, 20, tzinfo=timezone.utc),
-        )
-        save_flight(session, flight_a, USER_A_ID)
-        save_flight(session, flight_b, USER_B_ID)
-        session.commit()
-        session.close()
-
-    def test_list_only_own_flights(self, client_a, client_b, flights_seeded):
-        resp_a = client_a.get("/api/flights")
+    @pytest.mark.anyio
+    async def test_list_only_own_flights(self, asgi_app, async_client, flights_seeded):
+        _act_as(asgi_app, USER_A_ID)
+        resp_a = await async_client.get("/api/flights")
         assert resp_a.status_code == 200
         ids_a = [f["id"] for f in resp_a.json()]
         assert "flight-a-2026-03-01" in ids_a
         assert "flight-b-2026-03-01" not in ids_a
 
-        resp_b = client_b.get("/api/flights")
+        _act_as(asgi_app, USER_B_ID)
+        resp_b = await async_client.get("/api/flights")
         ids_b = [f["id"] for f in resp_b.json()]
         assert "flight-b-2026-03-01" in ids_b
         assert "flight-a-2026-03-01" not in ids_b
 
-    def test_can_view_other_users_flight(self, client_b, flights_seeded):
+    @pytest.mark.anyio
+    async def test_can_view_other_users_flight(self, asgi_app, async_client, flights_seeded):
         """Any authenticated user can view any flight (shareable links)."""
-        resp = client_b.get("/api/flights/flight-a-2026-03-01")
+        _act_as(asgi_app, USER_B_ID)
+        resp = await async_client.get("/api/flights/flight-a-2026-03-01")
         assert resp.status_code == 200
         assert resp.json()["id"] == "flight-a-2026-03-01"
 
-    def test_cannot_delete_other_users_flight(self, client_b, flights_seeded):
-        resp = client_b.delete("/api/flights/flight-a-2026-03-01")
+    @pytest.mark.anyio
+    async def test_cannot_delete_other_users_flight(self, asgi_app, async_client, flights_seeded):
+        _act_as(asgi_app, USER_B_ID)
+        resp = await async_client.delete("/api/flights/flight-a-2026-03-01")
         assert resp.status_code == 404
 
     def test_unauthenticated_api_returns_401(self, client_unauth):
         resp = client_unauth.get("/api/flights")
         assert resp.status_code == 401
+
+
+class TestAuthDatabase:
+    def test_foreign_keys_enforced(self, auth_db):
+        """Like production, a flight cannot reference a user that does not exist."""
+        with auth_db() as session:
+            session.add(FlightRow(id="orphan", user_id="no-such-user", target_date="2026-03-01"))
+            with pytest.raises(IntegrityError):
+                session.flush()
@@ -1,90 +1,61 @@
 """Tests for enhanced cloud layer detection (sounding/clouds.py)."""
 
-from weatherbrief.analysis.sounding.clouds import detect_cloud_layers
-from weatherbrief.models import DerivedLevel
-
-
-def test_single_cloud_layer():
-    """Detects a single cloud layer where dewpoint depression < 3C."""
-    levels = [
-        DerivedLevel(pressure_hpa=1000, altitude_ft=330, dewpoint_depression_c=8.0),
-        DerivedLevel(pressure_hpa=925, altitude_ft=2530, dewpoint_depression_c=2.0),
-        DerivedLevel(pressure_hpa=850, altitude_ft=4760, dewpoint_depression_c=1.5),
-        DerivedLevel(pressure_hpa=700, altitude_ft=9880, dewpoint_depression_c=10.0),
-    ]
-    layers = detect_cloud_layers(levels)
-    assert len(layers) == 1
-    assert layers[0].base_ft == 2530
-    assert layers[0].top_ft == 4760
-
-
-def test_no_cloud():
-    """No cloud when all dewpoint depression above threshold."""
-    levels = [
-        DerivedLevel(pressure_hpa=1000, altitude_ft=330, dewpoint_depression_c=5.0),
-        DerivedLevel(pressure_hpa=850, altitude_ft=4760, dewpoint_depression_c=8.0),
-        DerivedLevel(pressure_hpa=700, altitude_ft=9880, dewpoint_depression_c=12.0),
-    ]
-    layers = detect_cloud_layers(levels)
-    assert len(layers) == 0
-
-
-def test_two_layers():
-    """Detects two separate cloud layers."""
-    levels = [
-        DerivedLevel(pressure_hpa=1000, altitude_ft=330, dewpoint_depression_c=1.5),
-        DerivedLevel(pressure_hpa=925, altitude_ft=2530, dewpoint_depression_c=8.0),
-        DerivedLevel(pressure_hpa=850, altitude_ft=4760, dewpoint_depression_c=2.0),
-        DerivedLevel(pressure_hpa=700, altitude_ft=9880, dewpoint_depression_c=6.0),
-    ]
-    layers = detect_cloud_layers(levels)
-    assert len(layers) == 2
+import numpy as np
+import pytest
 
-
-def test_cloud_extending_to_top():
-    """Cloud extending to top of profile is captured."""
-    levels = [
-        DerivedLevel(pressure_hpa=1000, altitude_ft=330, dewpoint_depression_c=8.0),
-        DerivedLevel(pressure_hpa=500, altitude_ft=18040, dewpoint_depression_c=1.5),
-        DerivedLevel(pressure_hpa=300, altitude_ft=29860, dewpoint_depression_c=2.0),
-    ]
-    layers = detect_cloud_layers(levels)
-    assert len(layers) == 1
-    assert layers[0].base_ft == 18040
-    assert layers[0].top_ft == 29860
+from weatherbrief.analysis.sounding.clouds import detect_cloud_layers, find_cloud_runs
+from weatherbrief.models import DerivedLevel
 
 
-def test_coverage_ovc():
-    """Mean DD < 1C classifies as OVC."""
-    levels = [
-        DerivedLevel(pressure_hpa=925, altitude_ft=2530, dewpoint_depression_c=0.5),
-        DerivedLevel(pressure_hpa=850, altitude_ft=4760, dewpoint_depression_c=0.8),
+def _levels(*rows):
+    """Build DerivedLevels from (pressure_hpa, altitude_ft, dewpoint_depression_c) rows."""
+    return [
+        DerivedLevel(pressure_hpa=p, altitude_ft=alt, dewpoint_depression_c=dd)
+        for p, alt, dd in rows
     ]
-    layers = detect_cloud_layers(levels)
-    assert len(layers) == 1
-    assert layers[0].coverage.value == "ovc"
 
 
-def test_coverage_bkn():
-    """Mean DD 1-2C classifies as BKN."""
-    levels = [
-        DerivedLevel(pressure_hpa=925, altitude_ft=2530, dewpoint_depression_c=1.2),
-        DerivedLevel(pressure_hpa=850, altitude_ft=4760, dewpoint_depression_c=1.8),
-    ]
+# (levels, expected (base_ft, top_ft) per layer)
+LAYER_CASES = {
+    "single_layer": (
+        _levels((1000, 330, 8.0), (925, 2530, 2.0), (850, 4760, 1.5), (700, 9880, 10.0)),
+        [(2530, 4760)],
+    ),
+    "no_cloud": (
+        _levels((1000, 330, 5.0), (850, 4760, 8.0), (700, 9880, 12.0)),
+        [],
+    ),
+    "two_layers": (
+        _levels((1000, 330, 1.5), (925, 2530, 8.0), (850, 4760, 2.0), (700, 9880, 6.0)),
+        [(330, 330), (4760, 4760)],
+    ),
+    "extending_to_top": (
+        _levels((1000, 330, 8.0), (500, 18040, 1.5), (300, 29860, 2.0)),
+        [(18040, 29860)],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "levels, expected", LAYER_CASES.values(), ids=LAYER_CASES.keys(),
+)
+def test_layer_detection(levels, expected):
+    """Detects layers where dewpoint depression < 3C, bottom-up."""
     layers = detect_cloud_layers(levels)
-    assert len(layers) == 1
-    assert layers[0].coverage.value == "bkn"
+    assert [(layer.base_ft, layer.top_ft) for layer in layers] == expected
 
 
-def test_coverage_sct():
-    """Mean DD 2-3C classifies as SCT."""
-    levels = [
-        DerivedLevel(pressure_hpa=925, altitude_ft=2530, dewpoint_depression_c=2.5),
-        DerivedLevel(pressure_hpa=850, altitude_ft=4760, dewpoint_depression_c=2.8),
-    ]
+@pytest.mark.parametrize("dd_values, coverage", [
+    ((0.5, 0.8), "ovc"),  # mean DD < 1C
+    ((1.2, 1.8), "bkn"),  # mean DD 1-2C
+    ((2.5, 2.8), "sct"),  # mean DD 2-3C
+])
+def test_coverage(dd_values, coverage):
+    """Mean dewpoint depression maps to coverage category."""
+    levels = _levels((925, 2530, dd_values[0]), (850, 4760, dd_values[1]))
     layers = detect_cloud_layers(levels)
     assert len(layers) == 1
-    assert layers[0].coverage.value == "sct"
+    assert layers[0].coverage.value == coverage
 
 
 def test_missing_dd_skipped():
@@ -104,3 +75,14 @@ def test_missing_dd_skipped():
 def test_empty_levels():
     """Empty input returns empty list."""
     assert detect_cloud_layers([]) == []
+
+
+def test_find_cloud_runs_array():
+    """Array fast path returns inclusive index runs below threshold."""
+    dd = np.array([8.0, 2.0, 1.5, 10.0, 1.0, np.nan, 0.5, 0.8])
+    assert find_cloud_runs(dd) == [(1, 2), (4, 4), (6, 7)]
+
+
+def test_find_cloud_runs_no_cloud():
+    """No runs when every level is above threshold."""
+    assert find_cloud_runs(np.array([5.0, 8.0, 12.0])) == []
@@ -1,5 +1,8 @@
 """Tests for model comparison and divergence scoring."""
 
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
 from weatherbrief.analysis.comparison import compare_models
 from weatherbrief.models import AgreementLevel
 
@@ -66,3 +69,28 @@ def test_three_models():
     assert result.mean == 35.0
     assert result.spread == 10.0
     assert result.agreement == AgreementLevel.GOOD  # <15% spread
+
+
+@settings(max_examples=25, deadline=None)
+@given(a=st.floats(-50, 50), b=st.floats(-50, 50))
+def test_temperature_agreement_property(a, b):
+    """Agreement level follows the 2C / 5C spread thresholds for any pair."""
+    result = compare_models("temperature_c", {"gfs": a, "ecmwf": b})
+    spread = abs(a - b)
+    if spread <= 2.0:
+        expected = AgreementLevel.GOOD
+    elif spread <= 5.0:
+        expected = AgreementLevel.MODERATE
+    else:
+        expected = AgreementLevel.POOR
+    assert result.agreement == expected
+
+
+@settings(max_examples=25, deadline=None)
+@given(a=st.floats(0, 360), b=st.floats(0, 360))
+def test_wind_direction_spread_property(a, b):
+    """Circular spread never exceeds 180 degrees and is order-independent."""
+    forward = compare_models("wind_direction_deg", {"gfs": a, "ecmwf": b})
+    reverse = compare_models("wind_direction_deg", {"gfs": b, "ecmwf": a})
+    assert 0 <= forward.spread <= 180
+    assert forward.spread == reverse.spread
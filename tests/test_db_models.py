@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 import pytest
+from sqlalchemy.orm import Session, sessionmaker
 
 from weatherbrief.db.engine import DEV_USER_ID
 from weatherbrief.db.models import (
@@ -189,3 +190,54 @@ class TestBriefingUsageModel:
         db_session.flush()
 
         assert db_session.get(BriefingUsageRow, row_id) is None
+
+
+def _in_rolled_back_transaction(engine, session_factory, work) -> None:
+    """Run ``work(session)`` the way ``db_session``/``app_db`` do.
+
+    The session joins an outer transaction on its own connection through a
+    SAVEPOINT, and the outer transaction is rolled back afterwards.
+    """
+    conn = engine.connect()
+    trans = conn.begin()
+    try:
+        with session_factory(conn) as session:
+            work(session)
+    finally:
+        trans.rollback()
+        conn.close()
+
+
+def _commit_user(session) -> None:
+    session.add(UserRow(
+        id="committed-user", provider="local", provider_sub="committed",
+        email="committed@localhost", display_name="Committed",
+    ))
+    session.commit()
+    assert session.get(UserRow, "committed-user") is not None
+
+
+def _assert_no_user(session) -> None:
+    assert session.get(UserRow, "committed-user") is None
+
+
+class TestSessionIsolation:
+    """Commits made the way ``db_session`` and ``app_db`` make them are undone.
+
+    Each test commits in one rolled-back outer transaction, then checks a
+    fresh one on the same shared engine, so it does not rely on test order.
+    """
+
+    @pytest.mark.parametrize("session_factory", [
+        pytest.param(
+            lambda conn: Session(bind=conn, join_transaction_mode="create_savepoint"),
+            id="db_session",
+        ),
+        pytest.param(
+            lambda conn: sessionmaker(bind=conn, join_transaction_mode="create_savepoint")(),
+            id="app_db",
+        ),
+    ])
+    def test_commit_rolled_back_with_outer_transaction(self, db_engine, session_factory):
+        _in_rolled_back_transaction(db_engine, session_factory, _commit_user)
+        _in_rolled_back_transaction(db_engine, session_factory, _assert_no_user)
@@ -15,13 +15,14 @@ from weatherbrief.fetch.dwd_text import (
     fetch_dwd_text_forecasts,
 )
 
+# Payloads pre-encoded once, as latin-1 like the DWD server sends them
 SAMPLE_KURZFRIST = """\
 SXDL31 DWAV 100800
 Synoptische Übersicht Kurzfrist
 ausgegeben am Montag, den 10.02.2026 um 08 UTC
 
 Kurzfrist: Ein Hoch über Mitteleuropa sorgt für ruhiges Wetter.
-"""
+""".encode("latin-1")
 
 SAMPLE_MITTELFRIST = """\
 SXDL33 DWAV 101030
@@ -29,7 +30,7 @@ Synoptische Übersicht Mittelfrist
 ausgegeben am Montag, den 10.02.2026 um 10:30 UTC
 
 Mittelfrist: Graduelle Umstellung der Großwetterlage auf Westwetterlage.
-"""
+""".encode("latin-1")
 
 
 @responses.activate
@@ -53,6 +54,7 @@ def test_fetch_both_forecasts():
     assert isinstance(result, DWDTextForecasts)
     assert result.short_range is not None
     assert "Kurzfrist" in result.short_range
+    assert "über Mitteleuropa" in result.short_range
     assert result.medium_range is not None
     assert "Mittelfrist" in result.medium_range
     assert result.fetched_at is not None
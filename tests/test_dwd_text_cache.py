@@ -0,0 +1,93 @@
+"""Tests for the DWD text forecast TTL cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from weatherbrief.fetch import dwd_text_cache
+from weatherbrief.fetch.dwd_text import DWDTextForecasts
+from weatherbrief.fetch.dwd_text_cache import clear_memory_cache, get_or_fetch
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(env, tmp_path):
+    env(DATA_DIR=str(tmp_path))
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+@pytest.fixture
+def mock_fetch(mocker):
+    return mocker.patch(
+        "weatherbrief.fetch.dwd_text.fetch_dwd_text_forecasts",
+        side_effect=lambda: DWDTextForecasts(
+            short_range="Kurzfrist",
+            medium_range="Mittelfrist",
+            fetched_at=datetime.now(timezone.utc),
+        ),
+    )
+
+
+def test_second_call_hits_memory(mock_fetch):
+    first = get_or_fetch()
+    second = get_or_fetch()
+    assert second is first
+    mock_fetch.assert_called_once()
+
+
+def test_disk_entry_reused_across_processes(mock_fetch):
+    first = get_or_fetch()
+    clear_memory_cache()  # simulate a fresh process
+
+    second = get_or_fetch()
+    assert second == first
+    mock_fetch.assert_called_once()
+
+
+def test_expired_entry_refetched(mock_fetch):
+    get_or_fetch()
+    get_or_fetch(ttl_seconds=0)
+    assert mock_fetch.call_count == 2
+
+
+def test_failed_fetch_not_cached(mocker):
+    fetch = mocker.patch(
+        "weatherbrief.fetch.dwd_text.fetch_dwd_text_forecasts",
+        return_value=DWDTextForecasts(fetched_at=datetime.now(timezone.utc)),
+    )
+    get_or_fetch()
+    get_or_fetch()
+    assert fetch.call_count == 2
+
+
+def test_corrupt_disk_entry_ignored(mock_fetch, tmp_path):
+    hour = dwd_text_cache._issuance_hour(datetime.now(timezone.utc))
+    cache_dir = tmp_path / ".cache" / "dwd_text"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / f"{hour:%Y%m%dT%H}.json").write_text("not json")
+
+    result = get_or_fetch()
+    assert result.short_range == "Kurzfrist"
+    mock_fetch.assert_called_once()
+
+
+def test_new_hour_removes_older_disk_entries(mock_fetch, tmp_path):
+    cache_dir = tmp_path / ".cache" / "dwd_text"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "20260210T11.json").write_text("{}")
+    (cache_dir / "20260210T10.json").write_text("{}")
+
+    get_or_fetch()
+
+    hour = dwd_text_cache._issuance_hour(datetime.now(timezone.utc))
+    assert [p.name for p in cache_dir.iterdir()] == [f"{hour:%Y%m%dT%H}.json"]
+
+
+def test_is_fresh_boundary():
+    now = datetime(2026, 2, 10, 12, 30, tzinfo=timezone.utc)
+    forecasts = DWDTextForecasts(fetched_at=now - timedelta(seconds=1800))
+    assert not dwd_text_cache._is_fresh(forecasts, now, 1800)
+    assert dwd_text_cache._is_fresh(forecasts, now, 1801)
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
+import smtplib
 from datetime import datetime, timezone
 from email import message_from_bytes
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -20,7 +22,7 @@ from weatherbrief.notify.email import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_flight():
     return Flight(
         id="egtk_lsgs-2026-02-21",
@@ -34,7 +36,7 @@ def sample_flight():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pack():
     return BriefingPackMeta(
         flight_id="egtk_lsgs-2026-02-21",
@@ -48,7 +50,7 @@ def sample_pack():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def smtp_config():
     return SmtpConfig(
         host="smtp.example.com",
@@ -60,36 +62,56 @@ def smtp_config():
     )
 
 
-@pytest.fixture
-def pack_dir(tmp_path):
-    """Pack directory with digest.json."""
-    pack = tmp_path / "pack"
-    pack.mkdir()
-    digest = {
-        "assessment": "GREEN",
-        "assessment_reason": "Conditions favorable",
-        "synoptic": "High pressure dominant.",
-        "winds": "Light.",
-        "cloud_visibility": "Clear.",
-        "precipitation_convection": "None.",
-        "icing": "None.",
-        "specific_concerns": "None.",
-        "model_agreement": "Good.",
-        "trend": "Stable.",
-        "watch_items": "Monitor EGTK fog.",
-    }
-    (pack / "digest.json").write_text(json.dumps(digest))
+_DIGEST_BYTES = json.dumps({
+    "assessment": "GREEN",
+    "assessment_reason": "Conditions favorable",
+    "synoptic": "High pressure dominant.",
+    "winds": "Light.",
+    "cloud_visibility": "Clear.",
+    "precipitation_convection": "None.",
+    "icing": "None.",
+    "specific_concerns": "None.",
+    "model_agreement": "Good.",
+    "trend": "Stable.",
+    "watch_items": "Monitor EGTK fog.",
+}).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def pack_dir(tmp_path_factory):
+    """Pack directory with digest.json (read-only for the email tests)."""
+    pack = tmp_path_factory.mktemp("pack")
+    (pack / "digest.json").write_bytes(_DIGEST_BYTES)
     return pack
 
 
+@pytest.fixture
+def smtp_cls(mocker):
+    """Patched smtplib.SMTP whose context-managed server is spec'd on SMTP."""
+    server = MagicMock(spec=smtplib.SMTP)  # spec before SMTP is patched out
+    smtp_cls = mocker.patch("weatherbrief.notify.email.smtplib.SMTP")
+    smtp_cls.return_value.__enter__.return_value = server
+    return smtp_cls
+
+
+_SMTP_REQUIRED_ENV = (
+    "WEATHERBRIEF_SMTP_HOST",
+    "WEATHERBRIEF_SMTP_USER",
+    "WEATHERBRIEF_SMTP_PASSWORD",
+    "WEATHERBRIEF_FROM_EMAIL",
+)
+
+
 class TestSmtpConfig:
-    def test_from_env(self, monkeypatch):
-        monkeypatch.setenv("WEATHERBRIEF_SMTP_HOST", "mail.test.com")
-        monkeypatch.setenv("WEATHERBRIEF_SMTP_PORT", "465")
-        monkeypatch.setenv("WEATHERBRIEF_SMTP_USER", "user")
-        monkeypatch.setenv("WEATHERBRIEF_SMTP_PASSWORD", "pass")
-        monkeypatch.setenv("WEATHERBRIEF_FROM_EMAIL", "from@test.com")
-        monkeypatch.setenv("WEATHERBRIEF_SMTP_TLS", "false")
+    def test_from_env(self, env):
+        env(
+            WEATHERBRIEF_SMTP_HOST="mail.test.com",
+            WEATHERBRIEF_SMTP_PORT="465",
+            WEATHERBRIEF_SMTP_USER="user",
+            WEATHERBRIEF_SMTP_PASSWORD="pass",
+            WEATHERBRIEF_FROM_EMAIL="from@test.com",
+            WEATHERBRIEF_SMTP_TLS="false",
+        )
 
         cfg = SmtpConfig.from_env()
         assert cfg.host == "mail.test.com"
@@ -99,17 +121,15 @@ class TestSmtpConfig:
         assert cfg.from_address == "from@test.com"
         assert cfg.use_tls is False
 
-    def test_from_env_missing_raises(self, monkeypatch):
-        monkeypatch.delenv("WEATHERBRIEF_SMTP_HOST", raising=False)
-        with pytest.raises(ValueError, match="SMTP not fully configured"):
-            SmtpConfig.from_env()
-
-    def test_from_env_partial_raises(self, monkeypatch):
+    @pytest.mark.parametrize("missing", [
+        _SMTP_REQUIRED_ENV,
+        *[(name,) for name in _SMTP_REQUIRED_ENV],
+    ], ids=["all", *_SMTP_REQUIRED_ENV])
+    def test_from_env_incomplete_raises(self, env, missing):
         """Missing any one required var should raise."""
-        monkeypatch.setenv("WEATHERBRIEF_SMTP_HOST", "mail.test.com")
-        monkeypatch.delenv("WEATHERBRIEF_SMTP_USER", raising=False)
-        monkeypatch.delenv("WEATHERBRIEF_SMTP_PASSWORD", raising=False)
-        monkeypatch.delenv("WEATHERBRIEF_FROM_EMAIL", raising=False)
+        env({name: "set" for name in _SMTP_REQUIRED_ENV})
+        for name in missing:
+            del os.environ[name]
         with pytest.raises(ValueError, match="SMTP not fully configured"):
             SmtpConfig.from_env()
 
@@ -123,8 +143,8 @@ class TestBuildSubject:
         assert "D-2" in subject
 
     def test_no_assessment(self, sample_flight, sample_pack):
-        sample_pack.assessment = None
-        subject = _build_subject(sample_flight, sample_pack)
+        pack = sample_pack.model_copy(update={"assessment": None})
+        subject = _build_subject(sample_flight, pack)
         assert "[" not in subject
         assert "WeatherBrief" in subject
 
@@ -157,32 +177,26 @@ class TestSendBriefingEmail:
         with pytest.raises(ValueError, match="No email recipients"):
             send_briefing_email([], sample_flight, sample_pack, pack_dir, smtp_config)
 
-    def test_send_email_calls_smtp(self, sample_flight, sample_pack, pack_dir, smtp_config):
+    def test_send_email_calls_smtp(self, sample_flight, sample_pack, pack_dir, smtp_config, smtp_cls, mocker):
         """Verify SMTP send_message is called with correct structure."""
-        mock_pdf = b"%PDF-fake"
-        with (
-            patch("weatherbrief.notify.email.smtplib.SMTP") as mock_smtp_cls,
-            patch("weatherbrief.report.render.render_pdf", return_value=mock_pdf),
-        ):
-            mock_server = MagicMock()
-            mock_smtp_cls.return_value.__enter__ = MagicMock(return_value=mock_server)
-            mock_smtp_cls.return_value.__exit__ = MagicMock(return_value=False)
-
-            send_briefing_email(
-                ["pilot@test.com"],
-                sample_flight,
-                sample_pack,
-                pack_dir,
-                smtp_config,
-            )
-
-            mock_smtp_cls.assert_called_once_with("smtp.example.com", 587)
-            mock_server.starttls.assert_called_once()
-            mock_server.login.assert_called_once_with("test@example.com", "secret")
-            mock_server.send_message.assert_called_once()
-
-            # Verify message structure
-            msg = mock_server.send_message.call_args[0][0]
-            assert "GREEN" in msg["Subject"]
-            assert msg["To"] == "pilot@test.com"
-            assert msg["From"] == "briefing@example.com"
+        mocker.patch("weatherbrief.report.render.render_pdf", return_value=b"%PDF-fake")
+        server = smtp_cls.return_value.__enter__.return_value
+
+        send_briefing_email(
+            ["pilot@test.com"],
+            sample_flight,
+            sample_pack,
+            pack_dir,
+            smtp_config,
+        )
+
+        smtp_cls.assert_called_once_with("smtp.example.com", 587)
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("test@example.com", "secret")
+        server.send_message.assert_called_once_with(mocker.ANY)
+
+        # Verify message structure
+        (msg,) = server.send_message.call_args.args
+        assert "GREEN" in msg["Subject"]
+        assert msg["To"] == "pilot@test.com"
+        assert msg["From"] == "briefing@example.com"
@@ -3,6 +3,15 @@
 from __future__ import annotations
 
 import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from weatherbrief.api.encryption import _get_fernet, decrypt, encrypt
+
+
+@pytest.fixture(scope="session")
+def fernet_keys():
+    """Two distinct Fernet keys, generated once per session."""
+    return Fernet.generate_key().decode(), Fernet.generate_key().decode()
 
 
 class TestEncryption:
@@ -13,22 +22,16 @@ class TestEncryption:
         monkeypatch.setenv("ENVIRONMENT", "development")
         monkeypatch.delenv("CREDENTIAL_ENCRYPTION_KEY", raising=False)
 
-        from weatherbrief.api.encryption import decrypt, encrypt
-
         plaintext = '{"username": "alice", "password": "s3cret!"}'
         ciphertext = encrypt(plaintext)
         assert ciphertext != plaintext
         assert decrypt(ciphertext) == plaintext
 
-    def test_explicit_key(self, monkeypatch):
+    def test_explicit_key(self, monkeypatch, fernet_keys):
         """Uses CREDENTIAL_ENCRYPTION_KEY when set."""
-        from cryptography.fernet import Fernet
-
-        key = Fernet.generate_key().decode()
+        key, _ = fernet_keys
         monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", key)
 
-        from weatherbrief.api.encryption import decrypt, encrypt
-
         plaintext = "test-data"
         ciphertext = encrypt(plaintext)
         assert decrypt(ciphertext) == plaintext
@@ -39,8 +42,6 @@ class TestEncryption:
         monkeypatch.setenv("JWT_SECRET", "some-jwt-secret")
         monkeypatch.delenv("CREDENTIAL_ENCRYPTION_KEY", raising=False)
 
-        from weatherbrief.api.encryption import encrypt
-
         with pytest.raises(ValueError, match="CREDENTIAL_ENCRYPTION_KEY must be set"):
             encrypt("test")
 
@@ -50,25 +51,37 @@ class TestEncryption:
         monkeypatch.delenv("CREDENTIAL_ENCRYPTION_KEY", raising=False)
         monkeypatch.setenv("JWT_SECRET", "my-dev-secret")
 
-        from weatherbrief.api.encryption import decrypt, encrypt
-
         ct = encrypt("hello")
         assert decrypt(ct) == "hello"
 
-    def test_wrong_key_fails(self, monkeypatch):
+    def test_wrong_key_fails(self, monkeypatch, fernet_keys):
         """Decrypting with a different key raises an error."""
-        from cryptography.fernet import Fernet, InvalidToken
-
-        key1 = Fernet.generate_key().decode()
-        key2 = Fernet.generate_key().decode()
+        key1, key2 = fernet_keys
 
         monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", key1)
-        from weatherbrief.api.encryption import encrypt
-
         ciphertext = encrypt("secret")
 
         monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", key2)
-        from weatherbrief.api.encryption import decrypt
-
         with pytest.raises(InvalidToken):
             decrypt(ciphertext)
+
+    def test_fernet_cached_per_key_inputs(self, monkeypatch, fernet_keys):
+        """Same env reuses the derived Fernet; a changed key derives a new one."""
+        key1, key2 = fernet_keys
+        monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", key1)
+        first = _get_fernet()
+        assert _get_fernet() is first
+
+        monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", key2)
+        assert _get_fernet() is not first
+
+    def test_env_change_not_masked_by_cache(self, monkeypatch):
+        """Switching to production after a dev call still requires an explicit key."""
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        monkeypatch.delenv("CREDENTIAL_ENCRYPTION_KEY", raising=False)
+        monkeypatch.setenv("JWT_SECRET", "my-dev-secret")
+        encrypt("warm the cache")
+
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        with pytest.raises(ValueError, match="CREDENTIAL_ENCRYPTION_KEY must be set"):
+            encrypt("test")
@@ -9,6 +9,8 @@ import pytest
 from weatherbrief.db.engine import DEV_USER_ID
 from weatherbrief.models import BriefingPackMeta, Flight
 from weatherbrief.storage.flights import (
+    _flight_to_row,
+    _meta_to_row,
     delete_flight,
     list_flights,
     list_packs,
@@ -20,32 +22,16 @@ from weatherbrief.storage.flights import (
 )
 
 
-@pytest.fixture
-def sample_flight():
-    return Flight(
-        id="egtk_lsgs-2026-02-21",
-        user_id=DEV_USER_ID,
-        route_name="egtk_lsgs",
-        target_date="2026-02-21",
-        target_time_utc=9,
-        cruise_altitude_ft=8000,
-        flight_duration_hours=4.5,
-        created_at=datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
-    )
-
-
-@pytest.fixture
-def sample_pack_meta():
-    return BriefingPackMeta(
-        flight_id="egtk_lsgs-2026-02-21",
-        fetch_timestamp="2026-02-19T18:00:00Z",
-        days_out=2,
-        has_gramet=True,
-        has_skewt=True,
-        has_digest=True,
-        assessment="GREEN",
-        assessment_reason="Ridge established, models converging",
-    )
+def _save_flights_bulk(session, flights, user_id):
+    """Insert several new flights with one add_all + flush (seed data only)."""
+    session.add_all([_flight_to_row(f, user_id) for f in flights])
+    session.flush()
+
+
+def _save_packs_bulk(session, packs):
+    """Insert several pack metas with one add_all + flush (seed data only)."""
+    session.add_all([_meta_to_row(p) for p in packs])
+    session.flush()
 
 
 # --- Flight CRUD tests ---
@@ -71,8 +57,6 @@ class TestFlightCRUD:
         assert list_flights(db_session, dev_user) == []
 
     def test_list_multiple(self, db_session, dev_user, sample_flight):
-        save_flight(db_session, sample_flight, dev_user)
-
         flight2 = Flight(
             id="egtk_lfat-2026-03-01",
             user_id=dev_user,
@@ -81,7 +65,7 @@ class TestFlightCRUD:
             target_time_utc=10,
             created_at=datetime(2026, 2, 15, 12, 0, 0, tzinfo=timezone.utc),
         )
-        save_flight(db_session, flight2, dev_user)
+        _save_flights_bulk(db_session, [sample_flight, flight2], dev_user)
 
         flights = list_flights(db_session, dev_user)
         assert len(flights) == 2
@@ -108,6 +92,25 @@ class TestFlightCRUD:
             load_flight(db_session, sample_flight.id)
         assert list_flights(db_session, dev_user) == []
 
+    def test_delete_removes_packs_too(self, db_session, dev_user, sample_flight, sample_pack_meta, tmp_path):
+        save_flight(db_session, sample_flight, dev_user)
+        pack_dir = tmp_path / "pack"
+        pack_dir.mkdir()
+        (pack_dir / "digest.json").write_text("{}")
+        missing_dir = tmp_path / "already-gone"
+        _save_packs_bulk(db_session, [
+            sample_pack_meta.model_copy(update={"artifact_path": str(pack_dir)}),
+            sample_pack_meta.model_copy(update={
+                "fetch_timestamp": "2026-02-18T08:00:00Z",
+                "artifact_path": str(missing_dir),
+            }),
+        ])
+
+        removed = delete_flight(db_session, sample_flight.id)
+
+        assert removed == [pack_dir]
+        assert list_packs(db_session, sample_flight.id) == []
+
     def test_delete_nonexistent_raises(self, db_session):
         with pytest.raises(KeyError):
             delete_flight(db_session, "nonexistent")
@@ -137,7 +140,6 @@ class TestBriefingPacks:
 
     def test_list_packs_multiple(self, db_session, dev_user, sample_flight, sample_pack_meta):
         save_flight(db_session, sample_flight, dev_user)
-        save_pack_meta(db_session, sample_pack_meta)
 
         pack2 = BriefingPackMeta(
             flight_id=sample_flight.id,
@@ -146,7 +148,7 @@ class TestBriefingPacks:
             has_digest=True,
             assessment="AMBER",
         )
-        save_pack_meta(db_session, pack2)
+        _save_packs_bulk(db_session, [sample_pack_meta, pack2])
 
         packs = list_packs(db_session, sample_flight.id)
         assert len(packs) == 2
@@ -163,45 +165,3 @@ class TestBriefingPacks:
         pack_dir = pack_dir_for("user-123", "flight-abc", "2026-02-19T18:00:00Z")
         assert "user-123" in str(pack_dir)
         assert "flight-abc" in str(pack_dir)
-
-
-# --- Model tests ---
-
-
-class TestFlightModel:
-    def test_defaults(self):
-        f = Flight(
-            id="test-2026-01-01",
-            route_name="test",
-            target_date="2026-01-01",
-            created_at=datetime.now(tz=timezone.utc),
-        )
-        assert f.target_time_utc == 9
-        assert f.cruise_altitude_ft == 8000
-        assert f.flight_duration_hours == 0.0
-        assert f.user_id == ""
-
-    def test_json_round_trip(self, sample_flight):
-        json_str = sample_flight.model_dump_json()
-        loaded = Flight.model_validate_json(json_str)
-        assert loaded == sample_flight
-
-
-class TestBriefingPackMetaModel:
-    def test_defaults(self):
-        meta = BriefingPackMeta(
-            flight_id="test-2026-01-01",
-            fetch_timestamp="2026-01-01T00:00:00Z",
-            days_out=7,
-        )
-        assert meta.has_gramet is False
-        assert meta.has_skewt is False
-        assert meta.has_digest is False
-        assert meta.assessment is None
-        assert meta.id is None
-        assert meta.artifact_path == ""
-
-    def test_json_round_trip(self, sample_pack_meta):
-        json_str = sample_pack_meta.model_dump_json()
-        loaded = BriefingPackMeta.model_validate_json(json_str)
-        assert loaded == sample_pack_meta
@@ -3,32 +3,44 @@
 from __future__ import annotations
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
 
+import pytest
 import responses
 
-from weatherbrief.fetch.gramet import GRAMET_URL
+from weatherbrief.fetch.gramet import GRAMET_URL, AutorouterGramet
 
+_FAKE_PNG = b"\x89PNG\r\n\x1a\n" + bytes(100)
+_FAKE_PDF = b"%PDF-1.4" + bytes(100)
+
+
+@pytest.fixture(autouse=True)
+def mock_cred_cls(mocker):
+    """Patched AutorouterCredentialManager handing out a fixed token."""
+    cred_cls = mocker.patch("weatherbrief.fetch.gramet.AutorouterCredentialManager")
+    cred_cls.return_value.get_token.return_value = "test-token-123"
+    return cred_cls
 
-@responses.activate
-@patch("weatherbrief.fetch.gramet.AutorouterCredentialManager")
-def test_fetch_gramet(mock_cred_cls):
-    """GRAMET client calls API with correct params and returns content."""
-    from weatherbrief.fetch.gramet import AutorouterGramet
 
-    # Mock credential manager
-    mock_cred = MagicMock()
-    mock_cred.get_token.return_value = "test-token-123"
-    mock_cred_cls.return_value = mock_cred
+@pytest.fixture
+def mocked_responses():
+    """Requests mock with passthrough disabled; unregistered URLs fail."""
+    with responses.RequestsMock(assert_all_requests_are_fired=True) as rsps:
+        yield rsps
 
+
+@pytest.mark.parametrize("fmt, payload, content_type", [
+    ("png", _FAKE_PNG, "image/png"),
+    ("pdf", _FAKE_PDF, "application/pdf"),
+])
+def test_fetch_gramet(mocked_responses, fmt, payload, content_type):
+    """GRAMET client calls API with correct params and returns content."""
     # Mock HTTP response
-    fake_png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         GRAMET_URL,
-        body=fake_png,
+        body=payload,
         status=200,
-        content_type="image/png",
+        content_type=content_type,
     )
 
     client = AutorouterGramet(cache_dir="/tmp/test-cache")
@@ -38,45 +50,14 @@ def test_fetch_gramet(mock_cred_cls):
         altitude_ft=8000,
         departure_time=departure,
         duration_hours=4.5,
+        fmt=fmt,
     )
 
-    assert result == fake_png
+    assert result == payload
 
     # Verify request params
-    req = responses.calls[0].request
+    req = mocked_responses.calls[0].request
     assert "EGTK+LFPB+LSGS" in req.url or "EGTK%20LFPB%20LSGS" in req.url
     assert "altitude=8000" in req.url
-    assert "format=png" in req.url
+    assert f"format={fmt}" in req.url
     assert req.headers["Authorization"] == "Bearer test-token-123"
-
-
-@responses.activate
-@patch("weatherbrief.fetch.gramet.AutorouterCredentialManager")
-def test_fetch_gramet_pdf(mock_cred_cls):
-    """GRAMET client supports PDF format."""
-    from weatherbrief.fetch.gramet import AutorouterGramet
-
-    mock_cred = MagicMock()
-    mock_cred.get_token.return_value = "test-token"
-    mock_cred_cls.return_value = mock_cred
-
-    fake_pdf = b"%PDF-1.4" + b"\x00" * 100
-    responses.add(
-        responses.GET,
-        GRAMET_URL,
-        body=fake_pdf,
-        status=200,
-        content_type="application/pdf",
-    )
-
-    client = AutorouterGramet(cache_dir="/tmp/test-cache")
-    result = client.fetch_gramet(
-        icao_codes=["EGTK", "LSGS"],
-        altitude_ft=6000,
-        departure_time=datetime(2026, 2, 14, 9, 0),
-        duration_hours=3.0,
-        fmt="pdf",
-    )
-
-    assert result == fake_pdf
-    assert "format=pdf" in responses.calls[0].request.url
@@ -0,0 +1,65 @@
+"""Tests for the exact-match LLM digest cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from weatherbrief.digest.llm_cache import (
+    DEFAULT_TTL_SECONDS,
+    cache_key,
+    load_cached,
+    store_cached,
+)
+from weatherbrief.digest.llm_config import DigestConfig
+
+
+@pytest.fixture(autouse=True)
+def _isolated_data_dir(env, tmp_path):
+    env(DATA_DIR=str(tmp_path))
+
+
+def test_key_changes_with_any_input():
+    config = DigestConfig()
+    base = cache_key(config, "WeatherDigest", "system", "context")
+    assert cache_key(config, "WeatherDigest", "system", "context") == base
+    assert cache_key(config, "WeatherDigest", "system", "context!") != base
+    assert cache_key(config, "WeatherDigest", "system!", "context") != base
+    assert cache_key(config, "Other", "system", "context") != base
+    other_model = DigestConfig.model_validate({"llm": {"model": "gpt-4o"}})
+    assert cache_key(other_model, "WeatherDigest", "system", "context") != base
+
+
+def test_key_parts_are_delimited():
+    config = DigestConfig()
+    assert cache_key(config, "S", "ab", "c") != cache_key(config, "S", "a", "bc")
+
+
+def test_store_and_load_round_trip():
+    store_cached("k1", '{"a": 1}')
+    assert load_cached("k1") == '{"a": 1}'
+    assert load_cached("missing") is None
+
+
+def test_expired_entry_ignored(tmp_path):
+    store_cached("k1", "{}")
+    path = tmp_path / ".cache" / "llm_digest" / "k1.json"
+    old = time.time() - 3600
+    os.utime(path, (old, old))
+    assert load_cached("k1", ttl_seconds=7200) == "{}"
+    assert load_cached("k1", ttl_seconds=1800) is None
+    assert not path.exists()
+
+
+def test_store_sweeps_stale_entries(tmp_path):
+    store_cached("old", "{}")
+    store_cached("recent", "{}")
+    cache_dir = tmp_path / ".cache" / "llm_digest"
+    old = time.time() - DEFAULT_TTL_SECONDS - 60
+    os.utime(cache_dir / "old.json", (old, old))
+
+    store_cached("new", "{}")
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["new.json", "recent.json"]
@@ -11,6 +11,8 @@ from weatherbrief.digest.llm_config import DigestConfig
 from weatherbrief.digest.llm_digest import (
     DigestState,
     WeatherDigest,
+    _build_messages,
+    _structured_briefer,
     assemble_context_node,
     build_digest_graph,
     fetch_text_node,
@@ -28,6 +30,34 @@ from weatherbrief.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_data_dir(env, tmp_path):
+    """Keep the LLM digest cache out of the real data directory."""
+    env(DATA_DIR=str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_briefer():
+    """Each test patches create_llm, so drop briefers built by earlier tests."""
+    _structured_briefer.cache_clear()
+    yield
+    _structured_briefer.cache_clear()
+
+
+def _mock_structured_llm(mock_create_llm, digest):
+    """Wire create_llm so with_structured_output(...).invoke returns digest."""
+    mock_raw_msg = MagicMock()
+    mock_raw_msg.usage_metadata = {"input_tokens": 1000, "output_tokens": 200}
+    mock_structured = MagicMock()
+    mock_structured.invoke.return_value = {
+        "raw": mock_raw_msg,
+        "parsed": digest,
+        "parsing_error": None,
+    }
+    mock_create_llm.return_value.with_structured_output.return_value = mock_structured
+    return mock_structured
+
+
 @pytest.fixture
 def sample_digest():
     """A sample WeatherDigest for formatting tests."""
@@ -106,7 +136,7 @@ def test_format_digest_assessment_icons(sample_digest, sample_route):
     assert "\U0001f534" in text  # red circle
 
 
-@patch("weatherbrief.digest.llm_digest.fetch_dwd_text_forecasts")
+@patch("weatherbrief.digest.llm_digest.get_or_fetch")
 def test_fetch_text_node_success(mock_fetch):
     """fetch_text_node returns text forecasts on success."""
     from weatherbrief.fetch.dwd_text import DWDTextForecasts
@@ -121,7 +151,7 @@ def test_fetch_text_node_success(mock_fetch):
     assert result["text_forecasts"].short_range == "Test short"
 
 
-@patch("weatherbrief.digest.llm_digest.fetch_dwd_text_forecasts")
+@patch("weatherbrief.digest.llm_digest.get_or_fetch")
 def test_fetch_text_node_failure(mock_fetch):
     """fetch_text_node returns None on failure."""
     mock_fetch.side_effect = Exception("DWD down")
@@ -144,7 +174,7 @@ def test_assemble_context_node(minimal_snapshot):
 
 
 @patch("weatherbrief.digest.llm_digest.create_llm")
-@patch("weatherbrief.digest.llm_digest.fetch_dwd_text_forecasts")
+@patch("weatherbrief.digest.llm_digest.get_or_fetch")
 def test_run_digest_full_graph(mock_dwd, mock_create_llm, minimal_snapshot, sample_digest):
     """Full graph execution with mocked LLM produces a digest."""
     from weatherbrief.fetch.dwd_text import DWDTextForecasts
@@ -185,7 +215,7 @@ def test_run_digest_full_graph(mock_dwd, mock_create_llm, minimal_snapshot, samp
 
 
 @patch("weatherbrief.digest.llm_digest.create_llm")
-@patch("weatherbrief.digest.llm_digest.fetch_dwd_text_forecasts")
+@patch("weatherbrief.digest.llm_digest.get_or_fetch")
 def test_run_digest_llm_failure(mock_dwd, mock_create_llm, minimal_snapshot):
     """Graph handles LLM failure gracefully."""
     from weatherbrief.fetch.dwd_text import DWDTextForecasts
@@ -207,6 +237,70 @@ def test_run_digest_llm_failure(mock_dwd, mock_create_llm, minimal_snapshot):
     assert "API key invalid" in result["error"]
 
 
+@patch("weatherbrief.digest.llm_digest.create_llm")
+@patch("weatherbrief.digest.llm_digest.get_or_fetch")
+def test_run_digest_reuses_cached_response(mock_dwd, mock_create_llm, minimal_snapshot, sample_digest):
+    """Identical context with a temperature-0 config hits the cache, not the LLM."""
+    mock_dwd.side_effect = Exception("DWD down")
+    mock_structured = _mock_structured_llm(mock_create_llm, sample_digest)
+    config = DigestConfig()
+    target_time = datetime(2026, 2, 17, 9, 0, 0)
+
+    first = run_digest(minimal_snapshot, target_time, config)
+    second = run_digest(minimal_snapshot, target_time, config)
+
+    mock_structured.invoke.assert_called_once()
+    assert second["digest"] == first["digest"]
+    assert second["digest_text"] == first["digest_text"]
+    assert second.get("llm_input_tokens") is None  # no LLM usage on a hit
+
+
+@patch("weatherbrief.digest.llm_digest.create_llm")
+@patch("weatherbrief.digest.llm_digest.get_or_fetch")
+def test_run_digest_nonzero_temperature_not_cached(mock_dwd, mock_create_llm, minimal_snapshot, sample_digest):
+    mock_dwd.side_effect = Exception("DWD down")
+    mock_structured = _mock_structured_llm(mock_create_llm, sample_digest)
+    config = DigestConfig.model_validate({"llm": {"temperature": 0.7}})
+    target_time = datetime(2026, 2, 17, 9, 0, 0)
+
+    run_digest(minimal_snapshot, target_time, config)
+    run_digest(minimal_snapshot, target_time, config)
+
+    assert mock_structured.invoke.call_count == 2
+    mock_create_llm.assert_called_once()  # client reused across runs
+
+
+def test_graph_fetches_text_alongside_context_build():
+    """DWD fetch and quantitative context build are parallel branches into assemble."""
+    graph = build_digest_graph(DigestConfig()).get_graph()
+    edges = {(e.source, e.target) for e in graph.edges}
+
+    assert {("__start__", "fetch_text"), ("__start__", "build_suffix")} <= edges
+    assert {("fetch_text", "assemble"), ("build_suffix", "assemble")} <= edges
+
+
+def test_anthropic_messages_mark_cache_breakpoints(minimal_snapshot):
+    """Anthropic gets cache_control on the system prompt and the context prefix."""
+    state: DigestState = {
+        "snapshot": minimal_snapshot,
+        "target_time": datetime(2026, 2, 17, 9, 0, 0),
+    }
+    state.update(assemble_context_node(state))
+
+    messages = _build_messages(DigestConfig(), "system prompt", state)
+
+    system_blocks = messages[0]["content"]
+    user_blocks = messages[1]["content"]
+    assert system_blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert user_blocks[0]["text"] == state["context_prefix"]
+    assert user_blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in user_blocks[1]
+    assert "".join(b["text"] for b in user_blocks) == state["context"]
+
+    openai = DigestConfig.model_validate({"llm": {"provider": "openai", "model": "gpt-4o"}})
+    assert _build_messages(openai, "system prompt", state)[1]["content"] == state["context"]
+
+
 def test_weather_digest_model():
     """WeatherDigest model validates correctly."""
     digest = WeatherDigest(
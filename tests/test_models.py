@@ -2,7 +2,12 @@
 
 from datetime import datetime, timezone
 
+import pytest
+from pydantic import ValidationError
+
 from weatherbrief.models import (
+    BriefingPackMeta,
+    Flight,
     ForecastSnapshot,
     HourlyForecast,
     ModelSource,
@@ -98,6 +103,23 @@ def test_waypoint_track_destination(sample_route):
     assert abs(track - leg_bearing) < 0.01
 
 
+def test_leg_bearings_match_direct_computation(sample_route):
+    """Leg bearings follow the current waypoints on each leg; the route is frozen."""
+    wps = sample_route.waypoints
+    for i in range(len(wps) - 1):
+        assert sample_route.leg_bearing(i) == bearing_between(wps[i], wps[i + 1])
+    with pytest.raises(ValidationError):
+        sample_route.cruise_altitude_ft = 9000
+    assert sample_route == sample_route.model_copy()
+
+    reversed_route = sample_route.model_copy(update={"waypoints": wps[::-1]})
+    assert reversed_route.leg_bearing(0) == bearing_between(wps[-1], wps[-2])
+
+    edited = sample_route.model_copy(deep=True)
+    edited.waypoints[1] = wps[-1]
+    assert edited.leg_bearing(0) == bearing_between(wps[0], wps[-1])
+
+
 def test_altitude_to_pressure():
     """Standard atmosphere conversion for known values."""
     # Sea level
@@ -120,6 +142,33 @@ def test_hourly_level_at():
     assert h.level_at(500) is None
 
 
+def test_hourly_level_at_follows_level_changes():
+    """level_at sees replaced, extended, edited and copied-over ``pressure_levels``."""
+    h = HourlyForecast(
+        time=datetime(2026, 2, 21, 9, 0),
+        pressure_levels=[PressureLevelData(pressure_hpa=850, temperature_c=5)],
+    )
+    assert h.level_at(700) is None
+
+    h.pressure_levels.append(PressureLevelData(pressure_hpa=700, temperature_c=-3))
+    assert h.level_at(700).temperature_c == -3
+
+    h.pressure_levels[0] = PressureLevelData(pressure_hpa=600, temperature_c=-10)
+    assert h.level_at(850) is None
+    assert h.level_at(600).temperature_c == -10
+
+    copied = h.model_copy(update={
+        "pressure_levels": [PressureLevelData(pressure_hpa=850, temperature_c=1)],
+    })
+    assert copied.level_at(850).temperature_c == 1
+    assert copied.level_at(700) is None
+    assert h.level_at(600).temperature_c == -10
+
+    h.pressure_levels = [PressureLevelData(pressure_hpa=500, temperature_c=-20)]
+    assert h.level_at(850) is None
+    assert h.level_at(500).temperature_c == -20
+
+
 def test_waypoint_forecast_at_time(sample_waypoint):
     """WaypointForecast.at_time returns closest hour."""
     wf = WaypointForecast(
@@ -137,6 +186,59 @@ def test_waypoint_forecast_at_time(sample_waypoint):
     assert result.time == datetime(2026, 2, 21, 9, 0)
 
 
+@pytest.mark.parametrize("target, expected_hour", [
+    (datetime(2026, 2, 21, 0, 0), 6),  # before first
+    (datetime(2026, 2, 21, 6, 0), 6),  # exact
+    (datetime(2026, 2, 21, 7, 30), 6),  # tie -> earlier hour
+    (datetime(2026, 2, 21, 7, 31), 9),
+    (datetime(2026, 2, 21, 11, 0), 12),
+    (datetime(2026, 2, 22, 0, 0), 12),  # after last
+])
+def test_waypoint_forecast_at_time_bisect(sample_waypoint, target, expected_hour):
+    """Closest-hour lookup matches a linear scan, including ties and range edges."""
+    wf = WaypointForecast(
+        waypoint=sample_waypoint,
+        model=ModelSource.GFS,
+        fetched_at=datetime.now(timezone.utc),
+        hourly=[
+            HourlyForecast(time=datetime(2026, 2, 21, 12, 0)),  # unsorted input
+            HourlyForecast(time=datetime(2026, 2, 21, 6, 0)),
+            HourlyForecast(time=datetime(2026, 2, 21, 9, 0)),
+        ],
+    )
+
+    assert wf.at_time(target).time.hour == expected_hour
+    assert wf == wf.model_validate_json(wf.model_dump_json())  # cache not in equality
+
+
+def test_waypoint_forecast_at_time_follows_hourly_changes(sample_waypoint):
+    """at_time sees replaced, extended, edited and copied-over ``hourly`` lists."""
+    wf = WaypointForecast(
+        waypoint=sample_waypoint,
+        model=ModelSource.GFS,
+        fetched_at=datetime.now(timezone.utc),
+        hourly=[HourlyForecast(time=datetime(2026, 2, 21, 6, 0))],
+    )
+    target = datetime(2026, 2, 21, 12, 0)
+    assert wf.at_time(target).time.hour == 6
+
+    wf.hourly.append(HourlyForecast(time=datetime(2026, 2, 21, 9, 0)))
+    assert wf.at_time(target).time.hour == 9
+
+    wf.hourly[0] = HourlyForecast(time=datetime(2026, 2, 21, 10, 0))
+    assert wf.at_time(target).time.hour == 10
+
+    wf.hourly[1].time = datetime(2026, 2, 21, 13, 0)
+    assert wf.at_time(target).time.hour == 13
+
+    copied = wf.model_copy(update={"hourly": [HourlyForecast(time=target)]})
+    assert copied.at_time(target).time.hour == 12
+    assert wf.at_time(target).time.hour == 13
+
+    wf.hourly = [HourlyForecast(time=datetime(2026, 2, 21, 11, 0))]
+    assert wf.at_time(target).time.hour == 11
+
+
 def test_forecast_snapshot_roundtrip(sample_route):
     """ForecastSnapshot serializes and deserializes correctly."""
     snapshot = ForecastSnapshot(
@@ -263,3 +365,42 @@ def test_save_cross_section_separate_file(sample_route, tmp_path):
     cs_data = json.loads(cs_path.read_text())
     assert "cross_sections" in cs_data
     assert len(cs_data["cross_sections"]) == 1
+
+
+def test_flight_defaults():
+    f = Flight(
+        id="test-2026-01-01",
+        route_name="test",
+        target_date="2026-01-01",
+        created_at=datetime.now(tz=timezone.utc),
+    )
+    assert f.target_time_utc == 9
+    assert f.cruise_altitude_ft == 8000
+    assert f.flight_duration_hours == 0.0
+    assert f.user_id == ""
+
+
+def test_flight_json_round_trip(sample_flight):
+    json_str = sample_flight.model_dump_json()
+    loaded = Flight.model_validate_json(json_str)
+    assert loaded == sample_flight
+
+
+def test_briefing_pack_meta_defaults():
+    meta = BriefingPackMeta(
+        flight_id="test-2026-01-01",
+        fetch_timestamp="2026-01-01T00:00:00Z",
+        days_out=7,
+    )
+    assert meta.has_gramet is False
+    assert meta.has_skewt is False
+    assert meta.has_digest is False
+    assert meta.assessment is None
+    assert meta.id is None
+    assert meta.artifact_path == ""
+
+
+def test_briefing_pack_meta_json_round_trip(sample_pack_meta):
+    json_str = sample_pack_meta.model_dump_json()
+    loaded = BriefingPackMeta.model_validate_json(json_str)
+    assert loaded == sample_pack_meta
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
 import responses
 
 from weatherbrief.fetch.open_meteo import OpenMeteoClient, magnus_dewpoint
@@ -29,6 +30,45 @@ def test_magnus_dewpoint_very_dry():
     assert dp < -10
 
 
+def test_magnus_dewpoint_array_matches_scalar():
+    """Array input is evaluated element-wise, including the dry fallback."""
+    temps = [20.0, 15.0, 20.0, -5.0]
+    rhs = [50.0, 100.0, 0.0, 70.0]
+    dps = magnus_dewpoint(temps, rhs)
+    assert dps.shape == (4,)
+    for t, rh, dp in zip(temps, rhs, dps):
+        assert dp == pytest.approx(magnus_dewpoint(t, rh))
+    assert dps[2] == -10.0
+
+
+@responses.activate
+def test_fetch_forecast_derives_missing_dewpoints():
+    """Pressure-level dewpoints absent from the API are derived from T + RH."""
+    api_response = {
+        "hourly": {
+            "time": ["2026-02-21T09:00", "2026-02-21T10:00", "2026-02-21T11:00"],
+            "temperature_850hPa": [5.0, 2.0, None],
+            "relative_humidity_850hPa": [80, 50, 80],
+            "dewpoint_850hPa": [None, -5.0, None],
+        }
+    }
+    responses.add(
+        responses.GET,
+        "https://api.open-meteo.com/v1/gfs",
+        json=api_response,
+        status=200,
+    )
+
+    client = OpenMeteoClient()
+    wp = Waypoint(icao="EGTK", name="Oxford", lat=51.836, lon=-1.32)
+    result = client.fetch_forecast(wp, ModelSource.GFS)
+
+    dps = [h.level_at(850).dewpoint_c for h in result.hourly]
+    assert dps[0] == round(magnus_dewpoint(5.0, 80), 1)  # derived, at API resolution
+    assert dps[1] == -5.0  # API value kept
+    assert dps[2] is None  # no temperature to derive from
+
+
 @responses.activate
 def test_fetch_forecast_parses_response():
     """Client correctly parses a minimal Open-Meteo response."""
@@ -120,6 +160,32 @@ def test_fetch_all_models_continues_on_failure():
     assert results[0].model == ModelSource.GFS
 
 
+@responses.activate
+def test_fetch_all_models_preserves_model_order():
+    """Concurrent fetches come back in the order the models were requested."""
+    api_response = {
+        "hourly": {
+            "time": ["2026-02-21T09:00"],
+            "temperature_2m": [5.0],
+        }
+    }
+    for path in ("gfs", "ecmwf", "dwd-icon"):
+        responses.add(
+            responses.GET,
+            f"https://api.open-meteo.com/v1/{path}",
+            json=api_response,
+            status=200,
+        )
+
+    client = OpenMeteoClient()
+    wp = Waypoint(icao="EGTK", name="Oxford", lat=51.836, lon=-1.32)
+    models = [ModelSource.ICON, ModelSource.GFS, ModelSource.ECMWF]
+    results = client.fetch_all_models(wp, models)
+
+    assert [r.model for r in results] == models
+    assert len(responses.calls) == 3
+
+
 @responses.activate
 def test_fetch_all_models_skips_out_of_range():
     """fetch_all_models skips models whose range is shorter than days_out."""
@@ -17,12 +17,12 @@ from weatherbrief.models import (
 from weatherbrief.pipeline import BriefingOptions, BriefingResult, analyze_waypoint
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def target_time():
     return datetime(2026, 2, 21, 9, 0, 0, tzinfo=timezone.utc)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_forecasts(target_time):
     """Two model forecasts for the same waypoint."""
     wp = Waypoint(icao="EGTK", name="Oxford Kidlington", lat=51.8361, lon=-1.32)
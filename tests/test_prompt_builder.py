@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 
 import pytest
 
-from weatherbrief.digest.prompt_builder import build_digest_context
+from weatherbrief.digest.prompt_builder import build_digest_context, build_static_prefix
 from weatherbrief.fetch.dwd_text import DWDTextForecasts
 from weatherbrief.models import (
     AgreementLevel,
@@ -28,13 +28,29 @@ from weatherbrief.models import (
 )
 
 
-@pytest.fixture
+_TARGET_TIME = datetime(2026, 2, 17, 9, 0, 0)
+_FETCHED_AT = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+# Quantitative-detail needles: surface, weather, wind components,
+# icing (5000ft) and cloud layers (3000-6000ft)
+_QUANT_NEEDLES = (
+    "T=5.0C",
+    "Wind 270/12kt",
+    "Cloud=60%",
+    "Precip=0.5mm",
+    "CAPE=50J/kg",
+    "15kt headwind",
+    "5000",
+    "3000",
+    "6000",
+)
+
+
+@pytest.fixture(scope="module")
 def sample_snapshot(sample_route, sample_pressure_levels):
     """Build a minimal ForecastSnapshot for testing."""
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
-
     hourly = HourlyForecast(
-        time=target_time,
+        time=_TARGET_TIME,
         temperature_2m_c=5.0,
         dewpoint_2m_c=2.0,
         wind_speed_10m_kt=12.0,
@@ -50,7 +66,7 @@ def sample_snapshot(sample_route, sample_pressure_levels):
     forecast = WaypointForecast(
         waypoint=sample_route.waypoints[0],
         model=ModelSource.GFS,
-        fetched_at=datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc),
+        fetched_at=_FETCHED_AT,
         hourly=[hourly],
     )
 
@@ -74,7 +90,7 @@ def sample_snapshot(sample_route, sample_pressure_levels):
 
     analysis = WaypointAnalysis(
         waypoint=sample_route.waypoints[0],
-        target_time=target_time,
+        target_time=_TARGET_TIME,
         wind_components={
             "gfs": WindComponent(
                 wind_speed_kt=25.0,
@@ -106,48 +122,46 @@ def sample_snapshot(sample_route, sample_pressure_levels):
     )
 
 
-def test_build_context_basic(sample_snapshot):
-    """Context contains all required sections."""
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
-    context = build_digest_context(sample_snapshot, target_time)
+@pytest.fixture(scope="module")
+def base_context(sample_snapshot):
+    """Context without text forecasts or previous digest, built once."""
+    return build_digest_context(sample_snapshot, _TARGET_TIME)
+
 
-    assert "EGTK -> LFPB -> LSGS" in context
-    assert "2026-02-17" in context
-    assert "D-7" in context
-    assert "8000ft" in context
-    assert "QUANTITATIVE DATA" in context
-    assert "MODEL COMPARISON" in context
+def test_build_context_basic(base_context):
+    """Context contains all required sections."""
+    assert "EGTK -> LFPB -> LSGS" in base_context
+    assert "2026-02-17" in base_context
+    assert "D-7" in base_context
+    assert "8000ft" in base_context
+    assert "QUANTITATIVE DATA" in base_context
+    assert "MODEL COMPARISON" in base_context
 
 
 def test_build_context_with_text_forecasts(sample_snapshot):
     """Text forecasts section included when provided."""
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
     text_fcsts = DWDTextForecasts(
         short_range="Kurzfrist: Hochdruckeinfluss.",
         medium_range="Mittelfrist: Umstellung auf Westwetterlage.",
-        fetched_at=datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc),
+        fetched_at=_FETCHED_AT,
     )
 
-    context = build_digest_context(sample_snapshot, target_time, text_forecasts=text_fcsts)
+    context = build_digest_context(sample_snapshot, _TARGET_TIME, text_forecasts=text_fcsts)
 
     assert "TEXT FORECASTS" in context
     assert "Kurzfrist" in context
     assert "Mittelfrist" in context
 
 
-def test_build_context_without_text_forecasts(sample_snapshot):
+def test_build_context_without_text_forecasts(base_context):
     """No text forecasts section when not provided."""
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
-    context = build_digest_context(sample_snapshot, target_time)
-
-    assert "TEXT FORECASTS" not in context
+    assert "TEXT FORECASTS" not in base_context
 
 
 def test_build_context_with_previous_digest(sample_snapshot):
     """Trend section included when previous digest provided."""
     from weatherbrief.digest.llm_digest import WeatherDigest
 
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
     prev = WeatherDigest(
         assessment="AMBER",
         assessment_reason="Frontal passage timing uncertain",
@@ -162,44 +176,42 @@ def test_build_context_with_previous_digest(sample_snapshot):
         watch_items="Check updated TAFs tomorrow.",
     )
 
-    context = build_digest_context(sample_snapshot, target_time, previous_digest=prev)
+    context = build_digest_context(sample_snapshot, _TARGET_TIME, previous_digest=prev)
 
     assert "PREVIOUS DIGEST" in context
     assert "AMBER" in context
     assert "Frontal passage timing uncertain" in context
 
 
-def test_build_context_quantitative_detail(sample_snapshot):
+def test_build_context_quantitative_detail(base_context):
     """Quantitative data includes surface, wx, cruise-level, wind components, icing."""
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
-    context = build_digest_context(sample_snapshot, target_time)
+    missing = [needle for needle in _QUANT_NEEDLES if needle not in base_context]
+    assert not missing, missing
+    assert "moderate" in base_context.lower()  # icing risk
 
-    # Surface data
-    assert "T=5.0C" in context
-    assert "Wind 270/12kt" in context
 
-    # Weather data
-    assert "Cloud=60%" in context
-    assert "Precip=0.5mm" in context
-    assert "CAPE=50J/kg" in context
-
-    # Wind components
-    assert "15kt headwind" in context
-
-    # Icing
-    assert "moderate" in context.lower()
-    assert "5000" in context
-
-    # Cloud layers
-    assert "3000" in context
-    assert "6000" in context
+def test_build_context_model_comparison(base_context):
+    """Model comparison section includes divergence data."""
+    assert "temperature_c" in base_context
+    assert "good agreement" in base_context
+    assert "spread=1.0" in base_context
 
 
-def test_build_context_model_comparison(sample_snapshot):
-    """Model comparison section includes divergence data."""
-    target_time = datetime(2026, 2, 17, 9, 0, 0)
-    context = build_digest_context(sample_snapshot, target_time)
+def test_static_prefix_leads_context(sample_snapshot):
+    """Text forecasts and route come before run-specific data, byte-identical across runs."""
+    text_fcsts = DWDTextForecasts(
+        short_range="Kurzfrist: Hochdruckeinfluss.",
+        fetched_at=_FETCHED_AT,
+    )
 
-    assert "temperature_c" in context
-    assert "good agreement" in context
-    assert "spread=1.0" in context
+    prefix = build_static_prefix(sample_snapshot, text_fcsts)
+    context = build_digest_context(sample_snapshot, _TARGET_TIME, text_forecasts=text_fcsts)
+    later = sample_snapshot.model_copy(update={"days_out": 6, "fetch_date": "2026-02-11"})
+    later_context = build_digest_context(later, _TARGET_TIME, text_forecasts=text_fcsts)
+
+    assert context.startswith(prefix)
+    assert later_context.startswith(prefix)
+    assert "Kurzfrist" in prefix
+    assert "EGTK -> LFPB -> LSGS" in prefix
+    assert "D-7" not in prefix
+    assert "QUANTITATIVE DATA" not in prefix
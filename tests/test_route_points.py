@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from weatherbrief.fetch.route_points import interpolate_route
 from weatherbrief.models import RouteConfig, Waypoint
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def two_waypoint_route():
     """Simple two-waypoint route (~225 nm)."""
     return RouteConfig(
@@ -20,20 +21,37 @@ def two_waypoint_route():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def three_waypoint_route(sample_route):
     """Three-waypoint route from conftest (~482 nm)."""
     return sample_route
 
 
+def _interpolate(route, spacing_nm):
+    points = interpolate_route(route, spacing_nm=spacing_nm)
+    return points, np.array([p.distance_from_origin_nm for p in points])
+
+
+@pytest.fixture(scope="module")
+def two_waypoint_points(two_waypoint_route):
+    """Two-waypoint route at 20 nm spacing: (points, distances array)."""
+    return _interpolate(two_waypoint_route, 20.0)
+
+
+@pytest.fixture(scope="module")
+def three_waypoint_points(three_waypoint_route):
+    """Three-waypoint route at 20 nm spacing: (points, distances array)."""
+    return _interpolate(three_waypoint_route, 20.0)
+
+
 class TestInterpolateRoute:
-    def test_includes_all_waypoints(self, three_waypoint_route):
-        points = interpolate_route(three_waypoint_route, spacing_nm=20.0)
+    def test_includes_all_waypoints(self, three_waypoint_points):
+        points, _ = three_waypoint_points
         icaos = [p.waypoint_icao for p in points if p.waypoint_icao]
         assert icaos == ["EGTK", "LFPB", "LSGS"]
 
-    def test_waypoint_names_preserved(self, three_waypoint_route):
-        points = interpolate_route(three_waypoint_route, spacing_nm=20.0)
+    def test_waypoint_names_preserved(self, three_waypoint_points):
+        points, _ = three_waypoint_points
         wp_points = {p.waypoint_icao: p for p in points if p.waypoint_icao}
         assert wp_points["EGTK"].waypoint_name == "Oxford Kidlington"
         assert wp_points["LFPB"].waypoint_name == "Paris Le Bourget"
@@ -44,31 +62,29 @@ class TestInterpolateRoute:
         assert points[0].waypoint_icao == "EGTK"
         assert points[0].distance_from_origin_nm == 0.0
 
-    def test_distances_monotonically_increasing(self, three_waypoint_route):
-        points = interpolate_route(three_waypoint_route, spacing_nm=20.0)
-        for i in range(1, len(points)):
-            assert points[i].distance_from_origin_nm > points[i - 1].distance_from_origin_nm
-
-    def test_spacing_approximately_correct(self, two_waypoint_route):
-        points = interpolate_route(two_waypoint_route, spacing_nm=20.0)
-        # Check gaps between consecutive interpolated (non-waypoint) points
-        for i in range(1, len(points) - 1):
-            if points[i].waypoint_icao is None and points[i - 1].waypoint_icao is None:
-                gap = points[i].distance_from_origin_nm - points[i - 1].distance_from_origin_nm
-                assert abs(gap - 20.0) < 1.0
-
-    def test_interpolated_points_have_no_icao(self, two_waypoint_route):
-        points = interpolate_route(two_waypoint_route, spacing_nm=20.0)
+    def test_distances_monotonically_increasing(self, three_waypoint_points):
+        _, dists = three_waypoint_points
+        assert np.all(np.diff(dists) > 0)
+
+    def test_spacing_approximately_correct(self, two_waypoint_points):
+        points, dists = two_waypoint_points
+        # Gaps between consecutive interpolated (non-waypoint) points
+        interpolated = np.array([p.waypoint_icao is None for p in points])
+        both = interpolated[1:] & interpolated[:-1]
+        assert both.any()
+        assert np.all(np.abs(np.diff(dists)[both] - 20.0) < 1.0)
+
+    def test_interpolated_points_have_no_icao(self, two_waypoint_points):
+        points, _ = two_waypoint_points
         for p in points:
             if p is not points[0] and p is not points[-1]:
                 assert p.waypoint_icao is None
                 assert p.waypoint_name is None
 
-    def test_total_distance_reasonable(self, three_waypoint_route):
+    def test_total_distance_reasonable(self, three_waypoint_points):
         """EGTK-LFPB-LSGS is roughly 480 nm."""
-        points = interpolate_route(three_waypoint_route, spacing_nm=20.0)
-        total = points[-1].distance_from_origin_nm
-        assert 450 < total < 520
+        _, dists = three_waypoint_points
+        assert 450 < dists[-1] < 520
 
     def test_large_spacing_still_includes_waypoints(self, two_waypoint_route):
         """With spacing larger than the leg, only waypoints are returned."""
@@ -5,53 +5,19 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event, insert
 
-from weatherbrief.api.app import create_app
 from weatherbrief.api.usage import (
     DAILY_LIMITS,
     check_rate_limits,
     get_usage_summary,
     log_briefing_usage,
 )
-from weatherbrief.db.deps import current_user_id, get_db
 from weatherbrief.db.engine import DEV_USER_ID
-from weatherbrief.db.models import Base, BriefingUsageRow, UserPreferencesRow, UserRow
+from weatherbrief.db.models import BriefingUsageRow
 from weatherbrief.pipeline import BriefingUsage
 
 
-@pytest.fixture
-def app_db():
-    """In-memory SQLite engine + session factory."""
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
-    )
-
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_conn, _connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
-
-    Base.metadata.create_all(engine)
-    TestSession = sessionmaker(bind=engine)
-
-    session = TestSession()
-    session.add(UserRow(
-        id=DEV_USER_ID, provider="local", provider_sub="dev",
-        email="dev@localhost", display_name="Dev User", approved=True,
-    ))
-    session.add(UserPreferencesRow(user_id=DEV_USER_ID))
-    session.commit()
-    session.close()
-
-    yield TestSession
-    engine.dispose()
-
-
 @pytest.fixture
 def db_session(app_db):
     """Single DB session for unit tests."""
@@ -60,36 +26,12 @@ def db_session(app_db):
     session.close()
 
 
-@pytest.fixture
-def client(app_db, tmp_path, monkeypatch):
-    """Create a test client with isolated DB."""
-    import weatherbrief.api.routes as routes_mod
-
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    (config_dir / "routes.yaml").write_text("routes: {}\n")
-    monkeypatch.setattr(routes_mod, "CONFIG_DIR", config_dir)
-    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
-    monkeypatch.setenv("ENVIRONMENT", "development")
-    monkeypatch.setenv("JWT_SECRET", "test-secret")
-    app = create_app()
-    monkeypatch.delenv("CREDENTIAL_ENCRYPTION_KEY", raising=False)
-
-    def _override_get_db():
-        session = app_db()
-        try:
-            yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    app.dependency_overrides[current_user_id] = lambda: DEV_USER_ID
-
-    return TestClient(app, raise_server_exceptions=False)
+def _insert_usage(session, count: int, **fields) -> None:
+    """Bulk-insert count usage rows for the dev user in one executemany."""
+    session.execute(insert(BriefingUsageRow), [
+        {"user_id": DEV_USER_ID, "flight_id": f"f-{i}", **fields} for i in range(count)
+    ])
+    session.commit()
 
 
 class TestLogBriefingUsage:
@@ -152,10 +94,7 @@ class TestRateLimits:
         """429 when Open-Meteo daily limit exceeded."""
         from fastapi import HTTPException
 
-        for i in range(17):  # 17 * 3 = 51 > 50
-            usage = BriefingUsage(open_meteo_calls=3)
-            log_briefing_usage(db_session, DEV_USER_ID, f"f-{i}", usage)
-        db_session.commit()
+        _insert_usage(db_session, 17, open_meteo_calls=3)  # 17 * 3 = 51 > 50
 
         with pytest.raises(HTTPException) as exc_info:
             check_rate_limits(db_session, DEV_USER_ID)
@@ -166,10 +105,7 @@ class TestRateLimits:
         """429 when GRAMET daily limit exceeded."""
         from fastapi import HTTPException
 
-        for i in range(DAILY_LIMITS["gramet"]):
-            usage = BriefingUsage(gramet_fetched=True)
-            log_briefing_usage(db_session, DEV_USER_ID, f"f-{i}", usage)
-        db_session.commit()
+        _insert_usage(db_session, DAILY_LIMITS["gramet"], gramet_fetched=True)
 
         with pytest.raises(HTTPException) as exc_info:
             check_rate_limits(db_session, DEV_USER_ID)
@@ -180,34 +116,63 @@ class TestRateLimits:
         """429 when LLM digest daily limit exceeded."""
         from fastapi import HTTPException
 
-        for i in range(DAILY_LIMITS["llm_digest"]):
-            usage = BriefingUsage(llm_digest=True)
-            log_briefing_usage(db_session, DEV_USER_ID, f"f-{i}", usage)
-        db_session.commit()
+        _insert_usage(db_session, DAILY_LIMITS["llm_digest"], llm_digest=True)
 
         with pytest.raises(HTTPException) as exc_info:
             check_rate_limits(db_session, DEV_USER_ID)
         assert exc_info.value.status_code == 429
         assert "LLM" in exc_info.value.detail
 
+    def test_today_query_uses_user_time_index(self, db_session):
+        """The rate-limit aggregate is an index range scan, not a table scan."""
+        engine = db_session.get_bind()
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "briefing_usage" in statement:
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            check_rate_limits(db_session, DEV_USER_ID)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        statement, parameters = statements[-1]
+        plan = db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters,
+        ).fetchall()
+        assert any("ix_briefing_usage_user_id_timestamp" in row[-1] for row in plan)
+
     def test_yesterday_usage_not_counted(self, db_session):
         """Usage from yesterday doesn't count toward today's limits."""
         yesterday = datetime.now(timezone.utc) - timedelta(days=1)
-        for i in range(20):
-            row = BriefingUsageRow(
-                user_id=DEV_USER_ID,
-                flight_id=f"f-{i}",
-                timestamp=yesterday,
-                open_meteo_calls=3,
-                gramet_fetched=True,
-                llm_digest=True,
-            )
-            db_session.add(row)
-        db_session.commit()
+        _insert_usage(
+            db_session, 20,
+            timestamp=yesterday, open_meteo_calls=3, gramet_fetched=True, llm_digest=True,
+        )
 
         # Should not raise — all usage is from yesterday
         check_rate_limits(db_session, DEV_USER_ID)
 
+    def test_explicit_now_sets_day_boundary(self, db_session):
+        """The UTC day is taken from ``now``, not the wall clock."""
+        late = datetime(2026, 2, 10, 23, 30, tzinfo=timezone.utc)
+        usage = BriefingUsage(gramet_fetched=True)
+        for i in range(DAILY_LIMITS["gramet"]):
+            log_briefing_usage(db_session, DEV_USER_ID, f"f-{i}", usage, now=late)
+        db_session.commit()
+
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException):
+            check_rate_limits(db_session, DEV_USER_ID, now=late + timedelta(minutes=15))
+        check_rate_limits(db_session, DEV_USER_ID, now=late + timedelta(hours=1))
+
+        summary = get_usage_summary(db_session, DEV_USER_ID, now=late + timedelta(hours=1))
+        assert summary.today.gramet.used == 0
+        assert summary.month.gramet == DAILY_LIMITS["gramet"]
+
 
 class TestUsageSummary:
     """Test usage summary aggregation."""
@@ -265,15 +230,15 @@ class TestUsageSummary:
 class TestUsageAPI:
     """Test GET /api/user/usage endpoint."""
 
-    def test_get_usage_empty(self, client):
-        resp = client.get("/api/user/usage")
+    def test_get_usage_empty(self, api_client):
+        resp = api_client.get("/api/user/usage")
         assert resp.status_code == 200
         data = resp.json()
         assert data["today"]["briefings"] == 0
         assert data["today"]["open_meteo"]["limit"] == DAILY_LIMITS["open_meteo"]
         assert data["month"]["total_tokens"] == 0
 
-    def test_get_usage_with_data(self, client, app_db):
+    def test_get_usage_with_data(self, api_client, app_db):
         """Usage endpoint reflects logged data."""
         session = app_db()
         row = BriefingUsageRow(
@@ -289,7 +254,7 @@ class TestUsageAPI:
         session.commit()
         session.close()
 
-        resp = client.get("/api/user/usage")
+        resp = api_client.get("/api/user/usage")
         assert resp.status_code == 200
         data = resp.json()
         assert data["today"]["briefings"] == 1